@@ -20,7 +20,7 @@ from gui.signals import UserInputSendSignal, UserInputSignal
 from gui.speech_input_handler import SpeechInputHandler
 from gui.signals import ErrorSignal, StartStatusAnimationSignal, StopStatusAnimationSignal
 from gui.status_bar import ActivityStatus, StatusBar
-from gui.utils import resource_path
+from gui.utils import resource_path, ASSISTANT_TYPE, CHAT_ASSISTANT_TYPE
 
 
 class CustomSpinBox(QSpinBox):
@@ -40,7 +40,7 @@ class AssistantConfigDialog(QDialog):
     def __init__(
             self, 
             parent=None, 
-            assistant_type : str = "assistant",
+            assistant_type : str = ASSISTANT_TYPE,
             assistant_name : str = None,
             function_config_manager : FunctionConfigManager = None
     ):
@@ -76,8 +76,8 @@ class AssistantConfigDialog(QDialog):
         self.currentHypothesis = ""
         self.user_input_signal = UserInputSignal()
         self.user_input_send_signal = UserInputSendSignal()
-        self.user_input_signal.update_signal.connect(self.on_user_input)
-        self.user_input_send_signal.send_signal.connect(self.on_user_input_complete)
+        self.user_input_signal.update_signal.connect(self.on_user_input, Qt.QueuedConnection)
+        self.user_input_send_signal.send_signal.connect(self.on_user_input_complete, Qt.QueuedConnection)
         try:
             self.speech_input_handler = SpeechInputHandler(self, self.user_input_signal.update_signal, self.user_input_send_signal.send_signal)
         except ValueError as e:
@@ -296,7 +296,7 @@ class AssistantConfigDialog(QDialog):
                 list_widget = self.systemFunctionsList if function_type == 'system' else self.userFunctionsList
                 self.create_function_section(list_widget, function_type, funcs)
 
-        if self.assistant_type == "assistant":
+        if self.assistant_type == ASSISTANT_TYPE:
             # Section for managing code interpreter files
             self.setup_code_interpreter_files(toolsLayout)
 
@@ -371,9 +371,9 @@ class AssistantConfigDialog(QDialog):
         self.useDefaultSettingsCheckBox.stateChanged.connect(self.toggleCompletionSettings)
         completionLayout.addWidget(self.useDefaultSettingsCheckBox)
 
-        if self.assistant_type == "assistant":
+        if self.assistant_type == ASSISTANT_TYPE:
             self.init_assistant_completion_settings(completionLayout)
-        elif self.assistant_type == "chat_assistant":
+        elif self.assistant_type == CHAT_ASSISTANT_TYPE:
             self.init_chat_assistant_completion_settings(completionLayout)
 
         self.toggleCompletionSettings()
@@ -514,14 +514,14 @@ class AssistantConfigDialog(QDialog):
         # Determine if controls should be enabled based on the checkbox and assistant type
         isEnabled = not self.useDefaultSettingsCheckBox.isChecked()
         
-        if self.assistant_type == "assistant":
+        if self.assistant_type == ASSISTANT_TYPE:
             self.temperatureSlider.setEnabled(isEnabled)
             self.topPSlider.setEnabled(isEnabled)
             self.responseFormatComboBox.setEnabled(isEnabled)
             self.maxCompletionTokensEdit.setEnabled(isEnabled)
             self.maxPromptTokensEdit.setEnabled(isEnabled)
             self.truncationTypeComboBox.setEnabled(isEnabled)
-        elif self.assistant_type == "chat_assistant":
+        elif self.assistant_type == CHAT_ASSISTANT_TYPE:
             self.frequencyPenaltySlider.setEnabled(isEnabled)
             self.maxTokensEdit.setEnabled(isEnabled)
             self.presencePenaltySlider.setEnabled(isEnabled)
@@ -606,7 +606,7 @@ class AssistantConfigDialog(QDialog):
         self.functions = []
         self.file_search = False
         self.code_interpreter = False
-        if self.assistant_type == "assistant":
+        if self.assistant_type == ASSISTANT_TYPE:
             self.fileSearchCheckBox.setChecked(False)
             self.codeInterpreterCheckBox.setChecked(False)
         self.outputFolderPathEdit.clear()
@@ -771,7 +771,7 @@ class AssistantConfigDialog(QDialog):
             self.useDefaultSettingsCheckBox.setChecked(False)
             completion_settings = text_completion_config.to_dict()
             # Load settings into UI elements based on assistant type
-            if self.assistant_type == "assistant":
+            if self.assistant_type == ASSISTANT_TYPE:
                 self.temperatureSlider.setValue(completion_settings.get('temperature', 1.0) * 100)
                 self.topPSlider.setValue(completion_settings.get('top_p', 1.0) * 100)
                 self.responseFormatComboBox.setCurrentText(completion_settings.get('response_format', 'text'))
@@ -784,7 +784,7 @@ class AssistantConfigDialog(QDialog):
                     last_messages = truncation_strategy.get('last_messages')
                     if last_messages is not None:
                         self.lastMessagesSpinBox.setValue(last_messages)
-            elif self.assistant_type == "chat_assistant":
+            elif self.assistant_type == CHAT_ASSISTANT_TYPE:
                 self.frequencyPenaltySlider.setValue(completion_settings.get('frequency_penalty', 0) * 100)
                 self.maxTokensEdit.setValue(completion_settings.get('max_tokens', 1000))
                 self.presencePenaltySlider.setValue(completion_settings.get('presence_penalty', 0) * 100)
@@ -795,14 +795,14 @@ class AssistantConfigDialog(QDialog):
         else:
             # Apply default settings if no config is found
             self.useDefaultSettingsCheckBox.setChecked(True)
-            if self.assistant_type == "assistant":
+            if self.assistant_type == ASSISTANT_TYPE:
                 self.temperatureSlider.setValue(100)
                 self.topPSlider.setValue(100)
                 self.responseFormatComboBox.setCurrentText("text")
                 self.maxCompletionTokensEdit.setValue(1000)
                 self.maxPromptTokensEdit.setValue(1000)
                 self.truncationTypeComboBox.setCurrentText("auto")
-            elif self.assistant_type == "chat_assistant":
+            elif self.assistant_type == CHAT_ASSISTANT_TYPE:
                 self.frequencyPenaltySlider.setValue(0)
                 self.maxTokensEdit.setValue(1000)
                 self.presencePenaltySlider.setValue(0)
@@ -892,7 +892,7 @@ class AssistantConfigDialog(QDialog):
 
         # Conditional setup for completion settings based on assistant_type
         completion_settings = None
-        if self.assistant_type == "chat_assistant":
+        if self.assistant_type == CHAT_ASSISTANT_TYPE:
             if not self.useDefaultSettingsCheckBox.isChecked():
                 completion_settings = {
                     'frequency_penalty': self.frequencyPenaltySlider.value() / 100,
@@ -903,7 +903,7 @@ class AssistantConfigDialog(QDialog):
                     'top_p': self.topPSlider.value() / 100,
                     'max_text_messages': self.maxMessagesEdit.value()
                 }
-        elif self.assistant_type == "assistant":
+        elif self.assistant_type == ASSISTANT_TYPE:
             if not self.useDefaultSettingsCheckBox.isChecked():
                 truncation_strategy = {
                     'type': self.truncationTypeComboBox.currentText(),
@@ -951,10 +951,10 @@ class AssistantConfigDialog(QDialog):
             'model': self.modelComboBox.currentText(),
             'assistant_id': self.assistant_id if not self.is_create else '',
             'file_references': [self.fileReferenceList.item(i).text() for i in range(self.fileReferenceList.count())],
-            'tool_resources': tool_resources.to_dict() if self.assistant_type == "assistant" else None,
+            'tool_resources': tool_resources.to_dict() if self.assistant_type == ASSISTANT_TYPE else None,
             'functions': self.functions,
-            'file_search': self.fileSearchCheckBox.isChecked() if self.assistant_type == "assistant" else False,
-            'code_interpreter': self.codeInterpreterCheckBox.isChecked() if self.assistant_type == "assistant" else False,
+            'file_search': self.fileSearchCheckBox.isChecked() if self.assistant_type == ASSISTANT_TYPE else False,
+            'code_interpreter': self.codeInterpreterCheckBox.isChecked() if self.assistant_type == ASSISTANT_TYPE else False,
             'output_folder_path': self.outputFolderPathEdit.text(),
             'ai_client_type': self.aiClientComboBox.currentText(),
             'assistant_type': self.assistant_type,
@@ -994,6 +994,11 @@ class ExportAssistantDialog(QDialog):
         assistant_names = self.assistant_config_manager.get_all_assistant_names()
         return assistant_names
 
+    def reset(self):
+        # Refresh the assistant list when the dialog is reused
+        self.assistant_combo.clear()
+        self.assistant_combo.addItems(self.get_assistant_names())
+
     def export_assistant(self):
         assistant_name = self.assistant_combo.currentText()
         assistant_config = self.assistant_config_manager.get_config(assistant_name)
@@ -1025,7 +1030,7 @@ class ExportAssistantDialog(QDialog):
                 template_content = template_file.read()
 
             main_content = template_content.replace("ASSISTANT_NAME", assistant_name)
-            if assistant_config.assistant_type == "chat_assistant":
+            if assistant_config.assistant_type == CHAT_ASSISTANT_TYPE:
                 main_content = main_content.replace("assistant_client", "chat_assistant_client")
                 main_content = main_content.replace("AssistantClient", "ChatAssistantClient")
 
@@ -19,7 +19,7 @@ from azure.ai.assistant.management.conversation_thread_client import Conversatio
 from azure.ai.assistant.management.logger_module import logger
 from gui.assistant_client_manager import AssistantClientManager
 from gui.assistant_dialogs import AssistantConfigDialog
-from gui.utils import resource_path
+from gui.utils import resource_path, ASSISTANT_TYPE, CHAT_ASSISTANT_TYPE
 
 
 class AssistantItemWidget(QWidget):
@@ -335,16 +335,16 @@ class ConversationSidebar(QWidget):
         assistant_name = widget.label.text()
         assistant_config = self.assistant_config_manager.get_config(assistant_name)
         if assistant_config:
-            if assistant_config.assistant_type == "assistant":
+            if assistant_config.assistant_type == ASSISTANT_TYPE:
                 self.dialog = AssistantConfigDialog(parent=self.main_window, assistant_name=assistant_name, function_config_manager=self.main_window.function_config_manager)
             else:
-                self.dialog = AssistantConfigDialog(parent=self.main_window, assistant_type="chat_assistant", assistant_name=assistant_name, function_config_manager=self.main_window.function_config_manager)
+                self.dialog = AssistantConfigDialog(parent=self.main_window, assistant_type=CHAT_ASSISTANT_TYPE, assistant_name=assistant_name, function_config_manager=self.main_window.function_config_manager)
             self.dialog.assistantConfigSubmitted.connect(self.on_assistant_config_submitted)
             self.dialog.show()
 
     def on_assistant_config_submitted(self, assistant_config_json, ai_client_type, assistant_type):
         try:
-            if assistant_type == "chat_assistant":
+            if assistant_type == CHAT_ASSISTANT_TYPE:
                 assistant_client = ChatAssistantClient.from_json(assistant_config_json, self.main_window, self.main_window.connection_timeout)
             else:
                 assistant_client = AssistantClient.from_json(assistant_config_json, self.main_window, self.main_window.connection_timeout)
@@ -425,7 +425,7 @@ class ConversationSidebar(QWidget):
                 if not self.assistant_client_manager.get_client(name):
                     assistant_config : AssistantConfig = self.assistant_config_manager.get_config(name)
                     assistant_config.config_folder = "config"
-                    if assistant_config.assistant_type == "assistant":
+                    if assistant_config.assistant_type == ASSISTANT_TYPE:
                         assistant_client = AssistantClient.from_json(assistant_config.to_json(), self.main_window, self.main_window.connection_timeout)
                     else:
                         assistant_client = ChatAssistantClient.from_json(assistant_config.to_json(), self.main_window, self.main_window.connection_timeout)
@@ -532,6 +532,7 @@ class ConversationSidebar(QWidget):
             threads_client = ConversationThreadClient.get_instance(self._ai_client_type)
             #TODO separate threads per ai_client_type in the json file
             threads_client.set_current_conversation_thread(unique_thread_name)
+            self.main_window.active_thread_name = unique_thread_name
             self.main_window.conversation_view.conversationView.clear()
             # Retrieve the messages for the selected thread
             conversation = threads_client.retrieve_conversation(unique_thread_name, timeout=self.main_window.connection_timeout)
@@ -550,6 +551,8 @@ class ConversationSidebar(QWidget):
             threads_client = ConversationThreadClient.get_instance(self._ai_client_type)
             threads_client.delete_conversation_thread(thread_name)
             threads_client.save_conversation_threads()
+            if self.main_window.active_thread_name == thread_name:
+                self.main_window.active_thread_name = None
             
             # Clear and reload the thread list
             self.threadList.clear()
@@ -4,16 +4,17 @@
 # This software uses the PySide6 library, which is licensed under the GNU Lesser General Public License (LGPL).
 # For more details on PySide6's license, see <https://www.qt.io/licensing>
 
-from PySide6.QtWidgets import QDialog, QVBoxLayout, QLineEdit, QLabel, QPushButton, QComboBox, QTextEdit, QHBoxLayout, QListWidget, QListWidgetItem, QCheckBox
+from PySide6.QtWidgets import QDialog, QVBoxLayout, QLineEdit, QLabel, QPushButton, QComboBox, QPlainTextEdit, QHBoxLayout, QListWidget, QListWidgetItem, QCheckBox
 from PySide6.QtCore import Signal, Slot, Qt, QObject, QThread, Qt, QMetaObject, Q_ARG, QTimer
 
 import logging, threading
+from collections import deque
 
 from azure.ai.assistant.management.logger_module import logger
 
 
 class LogMessageProcessor(QObject):
-    updateUI = Signal(str)  # Signal to send processed log messages to the UI thread
+    updateUI = Signal(list)  # Signal to send batches of processed log messages to the UI thread
 
     def __init__(self):
         super().__init__()
@@ -44,21 +45,23 @@ class LogMessageProcessor(QObject):
 
     def flushBuffer(self):
         with self.thread_lock:
-            if self.messageBuffer:
-                for message in self.messageBuffer:
-                    self.updateUI.emit(message)
-                self.messageBuffer.clear()
+            messages = self.messageBuffer
+            self.messageBuffer = []
+        # Send the buffered messages to the UI thread as a single batch
+        if messages:
+            self.updateUI.emit(messages)
 
 
 class DebugViewDialog(QDialog):
+    MAX_LOG_LINES = 5000
 
     def __init__(self, broadcaster, parent=None):
         super(DebugViewDialog, self).__init__(parent)
         self.setWindowTitle("Debug View")
         self.resize(800, 800)
         self.broadcaster = broadcaster
-        # Store log messages
-        self.logMessages = []
+        # Store log messages, keeping as many as the log view shows
+        self.logMessages = deque(maxlen=self.MAX_LOG_LINES)
 
         mainLayout = QVBoxLayout()  # Top level layout is now vertical
 
@@ -82,14 +85,17 @@ class DebugViewDialog(QDialog):
 
         # Log View Section
         logViewLayout = QVBoxLayout()
-        self.textEdit = QTextEdit()
+        self.textEdit = QPlainTextEdit()
         self.textEdit.setReadOnly(True)
+        self.textEdit.setUndoRedoEnabled(False)
+        # Drop the oldest lines once the log grows beyond the limit
+        self.textEdit.setMaximumBlockCount(self.MAX_LOG_LINES)
         self.textEdit.setStyleSheet("""
-            QTextEdit {
+            QPlainTextEdit {
                 border: 1px solid #c0c0c0; /* Adjusted to have a 1px solid border */
                 border-color: #a0a0a0 #ffffff #ffffff #a0a0a0;
                 border-radius: 4px;
-                padding: 1px; /* Adds padding inside the QTextEdit widget */
+                padding: 1px; /* Adds padding inside the QPlainTextEdit widget */
             }
         """)
         logViewLayout.addWidget(QLabel("Log:"))
@@ -101,7 +107,7 @@ class DebugViewDialog(QDialog):
         self.clearButton = QPushButton("Clear")
         self.clearButton.setAutoDefault(False)
         self.clearButton.setDefault(False)
-        self.clearButton.clicked.connect(self.clear_log_window)
+        self.clearButton.clicked.connect(self.clear_log_window, Qt.DirectConnection)
         controlLayout.addWidget(QLabel("Log Level:"))
         controlLayout.addWidget(self.logLevelComboBox)
         controlLayout.addWidget(self.clearButton)
@@ -112,8 +118,7 @@ class DebugViewDialog(QDialog):
         logViewLayout.addWidget(openaiLoggingCheckBox)
 
         # Populate log level combo box
-        for level in ('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'):
-            self.logLevelComboBox.addItem(level, getattr(logging, level))
+        self.logLevelComboBox.addItems(['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'])
         self.logLevelComboBox.currentIndexChanged.connect(self.change_log_level)
         self.change_log_level(0)  # Set default log level
 
@@ -141,27 +146,30 @@ class DebugViewDialog(QDialog):
         self.logProcessor.moveToThread(self.processorThread)
         self.processorThread.started.connect(self.logProcessor.startTimer)
         self.processorThread.finished.connect(self.logProcessor.stopTimer)
-        self.logProcessor.updateUI.connect(self.append_text_slot)
+        # The log messages are flushed on the processor thread
+        self.logProcessor.updateUI.connect(self.append_text_slot, Qt.QueuedConnection)
         self.processorThread.start()
 
-    def append_text_slot(self, message):
+    def append_text_slot(self, messages):
         if self.is_filter_selected():
             # Filter based on selected items in the list box
             selected_filters = [self.filterList.item(i).text().lower() for i in range(self.filterList.count()) if self.filterList.item(i).checkState() == Qt.CheckState.Checked]
 
-            # Re-add messages that match any of the selected filters
-            if any(filter_word in message.lower() for filter_word in selected_filters):
-                self.textEdit.append(message)
+            # Add messages that match any of the selected filters
+            visible_messages = [message for message in messages if any(filter_word in message.lower() for filter_word in selected_filters)]
         else:
-            self.textEdit.append(message)
-        # Store the message
-        self.logMessages.append(message)
+            visible_messages = messages
+        # Append the whole batch at once to lay out the log view only once
+        if visible_messages:
+            self.textEdit.appendPlainText('\n'.join(visible_messages))
+        # Store the messages
+        self.logMessages.extend(messages)
 
     def queue_append_text(self, message):
         QMetaObject.invokeMethod(self.logProcessor, 'processMessage', Qt.QueuedConnection, Q_ARG(str, message))
 
     def toggle_openai_logging(self, state):
-        level = self.logLevelComboBox.itemData(self.logLevelComboBox.currentIndex())
+        level = getattr(logging, self.logLevelComboBox.currentText())
         openai_logger = logging.getLogger("openai")
         if state == Qt.CheckState.Checked.value:
             openai_logger.setLevel(level)
@@ -169,7 +177,7 @@ class DebugViewDialog(QDialog):
             openai_logger.setLevel(0)
 
     def change_log_level(self, index):
-        level = self.logLevelComboBox.itemData(index)
+        level = getattr(logging, self.logLevelComboBox.itemText(index))
         logger.setLevel(level)
 
     def clear_log_window(self):
@@ -192,14 +200,14 @@ class DebugViewDialog(QDialog):
             # Re-add messages that match any of the selected filters
             for message in self.logMessages:
                 if any(filter_word in message.lower() for filter_word in selected_filters):
-                    self.textEdit.append(message)
+                    self.textEdit.appendPlainText(message)
         else:
             # Get the current filter text
             filter_text = self.filterLineEdit.text().lower()
             # Re-add messages that match the filter
             for message in self.logMessages:
                 if filter_text in message.lower():
-                    self.textEdit.append(message)
+                    self.textEdit.appendPlainText(message)
 
     def add_filter_word(self):
         # Get the text from QLineEdit
@@ -301,6 +301,7 @@ class CreateFunctionDialog(QDialog):
 
         try:
             self.function_config_manager.load_function_configs()
+            self.main_window.signals.function_configs_changed.emit()
             self.refresh_dropdown()
         except Exception as e:
             QMessageBox.warning(self, "Error", f"An error occurred while reloading the function specs: {e}")
@@ -326,6 +327,7 @@ class CreateFunctionDialog(QDialog):
         try:
             self.function_config_manager.delete_user_function(function_name)
             self.function_config_manager.load_function_configs()
+            self.main_window.signals.function_configs_changed.emit()
             self.refresh_dropdown()
             QMessageBox.information(self, "Success", f"Function '{function_name}' removed successfully.")
         except Exception as e:
@@ -21,6 +21,10 @@ class StreamCapture(QObject):
 class LogBroadcaster:
     def __init__(self):
         self._subscribers = []
+        self._enabled = True
+
+    def set_enabled(self, enabled):
+        self._enabled = enabled
 
     def subscribe(self, callback):
         if callback not in self._subscribers:
@@ -31,5 +35,7 @@ class LogBroadcaster:
             self._subscribers.remove(callback)
 
     def emit(self, message):
+        if not self._enabled:
+            return
         for callback in self._subscribers:
             callback(message)
\ No newline at end of file
@@ -11,7 +11,8 @@ from PySide6.QtGui import QFont
 
 import threading
 from concurrent.futures import ThreadPoolExecutor
-import os, time, json
+import os, time, json, logging
+from collections import OrderedDict
 
 from azure.ai.assistant.management.ai_client_factory import AIClientFactory, AIClientType
 from azure.ai.assistant.management.attachment import Attachment, AttachmentType
@@ -32,23 +33,15 @@ from gui.assistant_client_manager import AssistantClientManager
 from gui.conversation_sidebar import ConversationSidebar
 from gui.diagnostic_sidebar import DiagnosticsSidebar
 from gui.conversation import ConversationView
-from gui.signals import (
-    ConversationAppendChunkSignal,
-    AppendConversationSignal,
-    ConversationViewClear,
-    StartProcessingSignal,
-    SpeechSynthesisCompleteSignal,
-    StartStatusAnimationSignal,
-    StopProcessingSignal,
-    StopStatusAnimationSignal,
-    UpdateConversationTitleSignal,
-    UserInputSendSignal,
-    UserInputSignal,
-    ErrorSignal,
-    ConversationAppendMessagesSignal,
-    ConversationAppendImageSignal
-)
-from gui.utils import init_system_assistant
+from gui.signals import ConversationChunkBuffer, GuiSignals
+from gui.utils import init_system_assistant, has_min_words
+
+# Number of speech synthesis summaries kept for reuse
+SPEECH_SUMMARY_CACHE_SIZE = 256
+# Shorter messages are spoken as they are, as summarizing them takes longer than speaking them
+SPEECH_SUMMARY_MIN_WORDS = 40
+SPEECH_SUMMARY_FILLER = "Let me summarize that for you."
+
 
 class MainWindow(QMainWindow, AssistantClientCallbacks, TaskManagerCallbacks):
 
@@ -61,7 +54,10 @@ class MainWindow(QMainWindow, AssistantClientCallbacks, TaskManagerCallbacks):
         self.use_system_assistant_for_thread_name : bool = False
         self.use_streaming_for_assistant : bool = True
         self.user_text_summarization_in_synthesis : bool = False
+        self.speech_summary_cache = OrderedDict()
+        self.speech_summary_lock = threading.Lock()
         self.active_ai_client_type = None
+        self.active_thread_name = None
         self.in_background = False
         self.initialize_singletons()
         self.initialize_ui()
@@ -81,7 +77,7 @@ class MainWindow(QMainWindow, AssistantClientCallbacks, TaskManagerCallbacks):
             self.init_system_assistants()
         except Exception as e:
             error_message = f"An error occurred while initializing the application: {e}"
-            self.error_signal.error_signal.emit(error_message)
+            self.signals.error.emit(error_message)
             logger.error(error_message)
 
     def init_system_assistants(self):
@@ -94,6 +90,7 @@ class MainWindow(QMainWindow, AssistantClientCallbacks, TaskManagerCallbacks):
 
     def initialize_variables(self):
         self.scheduled_task_threads = {}
+        self.scheduled_thread_names = set()  # reverse index of scheduled_task_threads values
         self.thread_lock = threading.Lock()
         self.assistants_processing = {}
         self.active_ai_client_type = AIClientType.AZURE_OPEN_AI # default to Azure OpenAI
@@ -149,11 +146,12 @@ class MainWindow(QMainWindow, AssistantClientCallbacks, TaskManagerCallbacks):
         self.diagnostics_sidebar = DiagnosticsSidebar(self)
 
         # setup menus
-        self.assistants_menu = AssistantsMenu(self)
-        self.functions_menu = FunctionsMenu(self)
-        self.tasks_menu = TasksMenu(self)
-        self.diagnostics_menu = DiagnosticsMenu(self)
-        self.settings_menu = SettingsMenu(self)
+        menu_bar = self.menuBar()
+        self.assistants_menu = AssistantsMenu(self, menu_bar)
+        self.functions_menu = FunctionsMenu(self, menu_bar)
+        self.tasks_menu = TasksMenu(self, menu_bar)
+        self.diagnostics_menu = DiagnosticsMenu(self, menu_bar)
+        self.settings_menu = SettingsMenu(self, menu_bar)
 
         # setup status bar
         self.active_client_label = QLabel("")
@@ -162,36 +160,26 @@ class MainWindow(QMainWindow, AssistantClientCallbacks, TaskManagerCallbacks):
 
     def initialize_signals(self):
         # setup signals
-        self.append_conversation_signal = AppendConversationSignal()
-        self.speech_hypothesis_signal = UserInputSignal()
-        self.speech_final_signal = UserInputSendSignal()
-        self.speech_synthesis_complete_signal = SpeechSynthesisCompleteSignal()
-        self.start_animation_signal = StartStatusAnimationSignal()
-        self.stop_animation_signal = StopStatusAnimationSignal()
-        self.start_processing_signal = StartProcessingSignal()
-        self.stop_processing_signal = StopProcessingSignal()
-        self.update_conversation_title_signal = UpdateConversationTitleSignal()
-        self.error_signal = ErrorSignal()
-        self.conversation_view_clear_signal = ConversationViewClear()
-        self.conversation_append_messages_signal = ConversationAppendMessagesSignal()
-        self.conversation_append_image_signal = ConversationAppendImageSignal()
-        self.conversation_append_chunk_signal = ConversationAppendChunkSignal()
+        self.signals = GuiSignals()
+        self.conversation_chunk_buffer = ConversationChunkBuffer()
 
         # Connect the signals to slots (methods)
-        self.append_conversation_signal.update_signal.connect(self.append_conversation_message)
-        self.speech_hypothesis_signal.update_signal.connect(self.on_speech_hypothesis)
-        self.speech_final_signal.send_signal.connect(self.on_user_input_complete)
-        self.speech_synthesis_complete_signal.complete_signal.connect(self.on_speech_synthesis_complete)
-        self.start_animation_signal.start_signal.connect(self.status_bar.start_animation)
-        self.stop_animation_signal.stop_signal.connect(self.status_bar.stop_animation)
-        self.start_processing_signal.start_signal.connect(self.start_processing_input)
-        self.stop_processing_signal.stop_signal.connect(self.stop_processing_input)
-        self.update_conversation_title_signal.update_signal.connect(self.conversation_sidebar.threadList.update_item_by_name)
-        self.error_signal.error_signal.connect(lambda error_message: QMessageBox.warning(self, "Error", error_message))
-        self.conversation_view_clear_signal.update_signal.connect(self.conversation_view.conversationView.clear)
-        self.conversation_append_messages_signal.append_signal.connect(self.conversation_view.append_messages)
-        self.conversation_append_image_signal.append_signal.connect(self.conversation_view.append_image)
-        self.conversation_append_chunk_signal.append_signal.connect(self.conversation_view.append_message_chunk)
+        self.signals.append_conversation.connect(self.append_conversation_message)
+        # The speech signals are emitted from the Speech SDK callback threads
+        self.signals.speech_hypothesis.connect(self.on_speech_hypothesis, Qt.QueuedConnection)
+        self.signals.speech_final.connect(self.on_user_input_complete, Qt.QueuedConnection)
+        self.signals.speech_synthesis_complete.connect(self.on_speech_synthesis_complete, Qt.QueuedConnection)
+        self.signals.start_animation.connect(self.status_bar.start_animation)
+        self.signals.stop_animation.connect(self.status_bar.stop_animation)
+        self.signals.start_processing.connect(self.start_processing_input)
+        self.signals.stop_processing.connect(self.stop_processing_input)
+        self.signals.update_conversation_title.connect(self.conversation_sidebar.threadList.update_item_by_name)
+        self.signals.error.connect(lambda error_message: QMessageBox.warning(self, "Error", error_message))
+        self.signals.conversation_view_clear.connect(self.conversation_view.conversationView.clear)
+        self.signals.conversation_append_messages.connect(self.conversation_view.append_messages)
+        self.signals.conversation_append_image.connect(self.conversation_view.append_image)
+        self.signals.function_configs_changed.connect(self.assistants_menu.on_function_configs_changed)
+        self.conversation_chunk_buffer.append_signal.connect(self.conversation_view.append_message_chunk)
 
     def initialize_ui_layout(self):
         # Create a splitter for sidebar and main content
@@ -233,8 +221,8 @@ class MainWindow(QMainWindow, AssistantClientCallbacks, TaskManagerCallbacks):
 
     def initialize_speech(self):
         try:
-            self.speech_input_handler = SpeechInputHandler(self, self.speech_hypothesis_signal.update_signal, self.speech_final_signal.send_signal)
-            self.speech_synthesis_handler = SpeechSynthesisHandler(self, self.speech_synthesis_complete_signal.complete_signal)
+            self.speech_input_handler = SpeechInputHandler(self, self.signals.speech_hypothesis, self.signals.speech_final)
+            self.speech_synthesis_handler = SpeechSynthesisHandler(self, self.signals.speech_synthesis_complete)
         except ValueError as e:
             QMessageBox.warning(self, "Warning", f"An error occurred while initializing the speech input handler: {e}")
             logger.error(f"Error initializing speech input handler: {e}")
@@ -253,6 +241,7 @@ class MainWindow(QMainWindow, AssistantClientCallbacks, TaskManagerCallbacks):
 
         self.conversation_view.conversationView.clear()
         self.active_ai_client_type = ai_client_type
+        self.active_thread_name = None
         client = None
         try:
             if self.active_ai_client_type == AIClientType.AZURE_OPEN_AI:
@@ -358,7 +347,7 @@ class MainWindow(QMainWindow, AssistantClientCallbacks, TaskManagerCallbacks):
                 updated_thread_name = self.update_conversation_title(user_input, thread_name, False)
                 end_time = time.time()
                 logger.debug(f"Total time taken for updating conversation title: {end_time - start_time} seconds")
-                self.update_conversation_title_signal.update_signal.emit(thread_name, updated_thread_name)
+                self.signals.update_conversation_title.emit(thread_name, updated_thread_name)
                 thread_name = updated_thread_name
 
             # get files from conversation thread list
@@ -370,7 +359,7 @@ class MainWindow(QMainWindow, AssistantClientCallbacks, TaskManagerCallbacks):
             self.conversation_view.inputField.clear()
         except Exception as e:
             error_message = f"An error occurred while processing the user input: {e}"
-            self.error_signal.error_signal.emit(error_message)
+            self.signals.error.emit(error_message)
             logger.error(error_message)
 
     def append_conversation_message(self, sender, message, color):
@@ -415,8 +404,8 @@ class MainWindow(QMainWindow, AssistantClientCallbacks, TaskManagerCallbacks):
 
         except Exception as e:
             error_message = f"An error occurred while processing the input: {e}"
-            self.error_signal.error_signal.emit(error_message)
-            self.stop_processing_signal.stop_signal.emit(assistant_name, is_scheduled_task)
+            self.signals.error.emit(error_message)
+            self.signals.stop_processing.emit(assistant_name, is_scheduled_task)
             logger.error(error_message)
 
     def _update_attachments_from_ui_to_thread(self, thread_client : ConversationThreadClient, thread_id, attachments_dicts):
@@ -453,7 +442,7 @@ class MainWindow(QMainWindow, AssistantClientCallbacks, TaskManagerCallbacks):
         self.conversation_sidebar.set_attachments_for_selected_thread(attachments_dicts)
 
     def _process_assistant_input(self, assistant_name, thread_name, is_scheduled_task):
-        self.start_processing_signal.start_signal.emit(assistant_name, is_scheduled_task)
+        self.signals.start_processing.emit(assistant_name, is_scheduled_task)
 
         assistant_client = self.assistant_client_manager.get_client(assistant_name)
         if assistant_client is not None:
@@ -466,7 +455,7 @@ class MainWindow(QMainWindow, AssistantClientCallbacks, TaskManagerCallbacks):
             end_time = time.time()
             logger.debug(f"Total time taken for processing user input: {end_time - start_time} seconds")
 
-        self.stop_processing_signal.stop_signal.emit(assistant_name, is_scheduled_task)
+        self.signals.stop_processing.emit(assistant_name, is_scheduled_task)
 
     def update_conversation_title(self, text, thread_name, is_scheduled_task):
         if not hasattr(self, 'conversation_title_creator'):
@@ -479,11 +468,15 @@ class MainWindow(QMainWindow, AssistantClientCallbacks, TaskManagerCallbacks):
         if is_scheduled_task:
             new_thread_name = "Scheduled_" + new_thread_name
         unique_thread_title = self.conversation_thread_clients[self.active_ai_client_type].set_conversation_thread_name(new_thread_name, thread_name)
+        if self.active_thread_name == thread_name:
+            self.active_thread_name = unique_thread_title
         return unique_thread_title
 
     def update_conversation_messages(self, conversation):
-        self.conversation_view_clear_signal.update_signal.emit()
-        self.conversation_append_messages_signal.append_signal.emit(conversation.messages)
+        # Deliver the streamed chunks still waiting in the buffer before the view is redrawn
+        self.conversation_chunk_buffer.flush()
+        self.signals.conversation_view_clear.emit()
+        self.signals.conversation_append_messages.emit(conversation.messages)
 
     def add_image_to_selected_thread(self, image_path):
         attachments_dicts = self.conversation_sidebar.threadList.get_attachments_for_selected_item()
@@ -506,11 +499,14 @@ class MainWindow(QMainWindow, AssistantClientCallbacks, TaskManagerCallbacks):
         if not self.speech_input_handler.is_initialized:
             QMessageBox.warning(self, "Error", "Speech input is not properly initialized, check the AZURE_AI_SPEECH_KEY and AZURE_AI_SPEECH_REGION environment variables are set correctly.")
             return False
+        if self.speech_synthesis_handler.is_initialized:
+            self.executor.submit(self.speech_synthesis_handler.warm_up)
         return self.speech_input_handler.start_listening_from_mic()
 
     def on_listening_stopped(self):
         logger.debug("on_listening_stopped on main_window")
         self.speech_input_handler.stop_listening_from_mic()
+        self.speech_synthesis_handler.cancel()
 
     def on_speech_synthesis_complete(self):
         logger.debug("on_speech_synthesis_complete on main_window")
@@ -533,17 +529,19 @@ class MainWindow(QMainWindow, AssistantClientCallbacks, TaskManagerCallbacks):
         )
 
     def on_run_update(self, assistant_name, run_identifier, run_status, thread_name, is_first_message = False, message : ConversationMessage = None):
-        logger.info(f"Run update for assistant {assistant_name} with run identifier {run_identifier}, status {run_status}, and thread name {thread_name}")
-
-        is_current_thread = self.conversation_thread_clients[self.active_ai_client_type].is_current_conversation_thread(thread_name)
-        if not is_current_thread:
-            logger.info(f"Run update for assistant {assistant_name} with run identifier {run_identifier} and status {run_status} is not current assistant thread, conversation not updated")
+        # Called for every streamed chunk, so avoid formatting log messages unless debug logging is enabled
+        is_debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        if is_debug_enabled:
+            logger.debug(f"Run update for assistant {assistant_name} with run identifier {run_identifier}, status {run_status}, and thread name {thread_name}")
+
+        if thread_name != self.active_thread_name:
+            if is_debug_enabled:
+                logger.debug(f"Run update for assistant {assistant_name} with run identifier {run_identifier} and status {run_status} is not current assistant thread, conversation not updated")
             return
 
         if run_status == "streaming":
             if message.text_message:
-                logger.info(f"Run update for assistant {assistant_name} with run identifier {run_identifier} and status {run_status} is streaming")
-                self.conversation_append_chunk_signal.append_signal.emit(assistant_name, message.text_message.content, is_first_message)
+                self.conversation_chunk_buffer.queue(assistant_name, message.text_message.content, is_first_message)
             return
 
         conversation = self.conversation_thread_clients[self.active_ai_client_type].retrieve_conversation(thread_name, timeout=self.connection_timeout)
@@ -575,27 +573,59 @@ class MainWindow(QMainWindow, AssistantClientCallbacks, TaskManagerCallbacks):
         logger.info(f"Run end for assistant {assistant_name} with run identifier {run_identifier} and thread name {thread_name}")
 
         conversation = self.conversation_thread_clients[self.active_ai_client_type].retrieve_conversation(thread_name, timeout=self.connection_timeout)
-        last_assistant_message = conversation.get_last_text_message(assistant_name)
+
+        # Walk the messages once to find the last text message of the assistant and collect the file messages,
+        # messages are ordered from newest to oldest so the first match is the last text message
+        last_assistant_message = None
+        file_messages = []
+        for message in conversation.messages:
+            if last_assistant_message is None and message.sender == assistant_name and message.text_message is not None:
+                last_assistant_message = message.text_message
+            file_messages.extend(message.file_messages)
+
         if self.conversation_sidebar.is_listening:
             # microphone needs to be stopped before speech synthesis otherwise synthesis output will be heard by the microphone
             self.speech_input_handler.stop_listening_from_mic()
             logger.debug(f"Start speech synthesis for last assistant message: {last_assistant_message.content}")
             input_text = last_assistant_message.content
-            if self.user_text_summarization_in_synthesis and hasattr(self, 'speech_transcription_summarizer'):
-                input_text = self.speech_transcription_summarizer.process_messages(user_request=input_text, stream=False)
+            if self.user_text_summarization_in_synthesis and hasattr(self, 'speech_transcription_summarizer') \
+                    and has_min_words(input_text, SPEECH_SUMMARY_MIN_WORDS):
+                input_text = self.summarize_for_speech(input_text)
             result_future = self.speech_synthesis_handler.synthesize_speech_async(input_text)
             logger.debug(f"Speech synthesis result_future: {result_future}")
             # when synthesis is complete, on_speech_synthesis_complete will be called and listening from microphone will be started again
 
         self.diagnostics_sidebar.end_run_signal.end_signal.emit(assistant_name, run_identifier, run_end_time, last_assistant_message.content)
-        assistant_config = self.assistant_config_manager.get_config(assistant_name)
 
         # copy files from conversation to output folder at the end of the run
-        for message in conversation.messages:
-            if len(message.file_messages) > 0:
-                for file_message in message.file_messages:
-                    file_path = file_message.retrieve_file(assistant_config.output_folder_path)
-                    logger.debug(f"File downloaded to {file_path} on run end")
+        if file_messages:
+            assistant_config = self.assistant_config_manager.get_config(assistant_name)
+            if assistant_config is None:
+                logger.warning(f"Assistant {assistant_name} configuration not found, files of the run are not downloaded")
+                return
+            output_folder_path = assistant_config.output_folder_path
+            for file_message in file_messages:
+                file_path = file_message.retrieve_file(output_folder_path)
+                logger.debug(f"File downloaded to {file_path} on run end")
+
+    def summarize_for_speech(self, text):
+        # Reuse the summary of a message that has already been summarized, e.g. a repeated answer.
+        # Runs on the executor threads, so the cache is only accessed under the lock
+        key = text.strip()
+        with self.speech_summary_lock:
+            summary = self.speech_summary_cache.get(key)
+            if summary is not None:
+                self.speech_summary_cache.move_to_end(key)
+                return summary
+        # Fill the silence while the summary is requested, the summary is spoken after the filler
+        self.speech_synthesis_handler.synthesize_filler_async(SPEECH_SUMMARY_FILLER)
+        summary = self.speech_transcription_summarizer.process_messages(user_request=text, stream=False)
+        with self.speech_summary_lock:
+            self.speech_summary_cache[key] = summary
+            self.speech_summary_cache.move_to_end(key)
+            if len(self.speech_summary_cache) > SPEECH_SUMMARY_CACHE_SIZE:
+                self.speech_summary_cache.popitem(last=False)
+        return summary
 
     # Callbacks for TaskManagerCallbacks
     def on_task_started(self, task: Task, schedule_id):
@@ -603,6 +633,7 @@ class MainWindow(QMainWindow, AssistantClientCallbacks, TaskManagerCallbacks):
             if schedule_id not in self.scheduled_task_threads:
                 thread_name = self.setup_conversation_thread(True)
                 self.scheduled_task_threads[schedule_id] = thread_name
+                self.scheduled_thread_names.add(thread_name)
                 logger.info(f"Created thread {thread_name} for scheduled task {task.id}")
             logger.info(f"Task: {task.id} started with assistant {task.assistant_name}")
 
@@ -631,32 +662,40 @@ class MainWindow(QMainWindow, AssistantClientCallbacks, TaskManagerCallbacks):
                 self.handle_execution(task_request, schedule_id, assistant)
 
     def handle_execution(self, user_request, schedule_id, assistant_name):
+        # Hold the lock only while accessing scheduled_task_threads, the title update and
+        # input processing are remote calls and must not serialize other scheduled tasks
         with self.thread_lock:
             thread_name = self.scheduled_task_threads.get(schedule_id)
-            logger.info(f"Handling execution for scheduled task {schedule_id} with thread {thread_name}")
-            # If the thread is selected, append the update to the conversation
-            if self.conversation_sidebar.threadList.is_thread_selected(thread_name):
-                logger.info(f"Thread {thread_name} is selected, appending update to conversation")
-                self.append_conversation_signal.update_signal.emit("user", user_request, 'blue')
 
-            if self.use_system_assistant_for_thread_name:
-                updated_thread_name = self.update_conversation_title(user_request, thread_name, True)
-                self.update_conversation_title_signal.update_signal.emit(thread_name, updated_thread_name)
-                thread_name = updated_thread_name
+        logger.info(f"Handling execution for scheduled task {schedule_id} with thread {thread_name}")
+        # If the thread is selected, append the update to the conversation
+        if self.conversation_sidebar.threadList.is_thread_selected(thread_name):
+            logger.info(f"Thread {thread_name} is selected, appending update to conversation")
+            self.signals.append_conversation.emit("user", user_request, 'blue')
+
+        if self.use_system_assistant_for_thread_name:
+            updated_thread_name = self.update_conversation_title(user_request, thread_name, True)
+            self.signals.update_conversation_title.emit(thread_name, updated_thread_name)
+            thread_name = updated_thread_name
 
+        with self.thread_lock:
+            previous_thread_name = self.scheduled_task_threads.get(schedule_id)
+            if previous_thread_name != thread_name:
+                self.scheduled_thread_names.discard(previous_thread_name)
             self.scheduled_task_threads[schedule_id] = thread_name
+            self.scheduled_thread_names.add(thread_name)
 
-            # Process the scheduled task
-            assistant_list = [assistant_name]
-            self.process_input(user_request, assistant_list, thread_name, True)
+        # Process the scheduled task
+        assistant_list = [assistant_name]
+        self.process_input(user_request, assistant_list, thread_name, True)
 
     def cleanup_scheduled_thread(self, schedule_id):
         with self.thread_lock:  # Ensure thread-safe access
             if schedule_id in self.scheduled_task_threads:
-                del self.scheduled_task_threads[schedule_id]
+                self.scheduled_thread_names.discard(self.scheduled_task_threads.pop(schedule_id))
 
     def _is_thread_name_in_scheduled_tasks(self, thread_name):
-        return thread_name in self.scheduled_task_threads.values()
+        return thread_name in self.scheduled_thread_names
 
     # PySide6 overrides, UI events
     def changeEvent(self, event):
@@ -665,12 +704,16 @@ class MainWindow(QMainWindow, AssistantClientCallbacks, TaskManagerCallbacks):
                 self.in_background = False
             else:
                 self.in_background = True
+        elif event.type() == QEvent.WindowStateChange:
+            self.status_bar.set_paused(self.isMinimized())
 
     def closeEvent(self, event):
         try:
             # Stop microphone listening if it's on
             if hasattr(self, 'speech_input_handler') and self.speech_input_handler is not None:
                 self.speech_input_handler.stop_listening_from_mic()
+            if hasattr(self, 'speech_synthesis_handler') and self.speech_synthesis_handler is not None:
+                self.speech_synthesis_handler.cancel()
             self.assistant_config_manager.save_configs()
             for ai_client_type in AIClientType:
                 logger.debug(f"CloseEvent: save_conversation_threads for ai_client_type {ai_client_type.name}")
@@ -6,197 +6,265 @@
 
 from PySide6.QtWidgets import QDialog, QMessageBox
 from PySide6.QtGui import QAction
+from PySide6.QtCore import QTimer
 
 from azure.ai.assistant.management.assistant_client import AssistantClient
 from azure.ai.assistant.management.ai_client_factory import AIClientType
 from azure.ai.assistant.management.chat_assistant_client import ChatAssistantClient
-from azure.ai.assistant.management.function_config_manager import FunctionConfigManager
 from azure.ai.assistant.management.logger_module import logger, add_broadcaster_to_logger
-from gui.debug_dialog import DebugViewDialog
 from gui.assistant_dialogs import AssistantConfigDialog, ExportAssistantDialog
-from gui.function_dialogs import CreateFunctionDialog, FunctionErrorsDialog
-from gui.task_dialogs import CreateTaskDialog, ScheduleTaskDialog
-from gui.settings_dialogs import ClientSettingsDialog, GeneralSettingsDialog
-from gui.assistant_client_manager import AssistantClientManager
 from gui.log_broadcaster import LogBroadcaster
+from gui.signals import AssistantClientCreatedSignal
+from gui.utils import ASSISTANT_TYPE, CHAT_ASSISTANT_TYPE
+# The dialogs opened from the functions, diagnostics, settings and tasks menus are imported on first use
+
+_CLIENT_BUILDERS = {
+    ASSISTANT_TYPE: AssistantClient.from_json,
+    CHAT_ASSISTANT_TYPE: ChatAssistantClient.from_json,
+}
+
+_CLIENT_TYPE_BY_NAME = {client_type.name: client_type for client_type in AIClientType}
+
+
+_message_boxes = {}
+
+
+def _show_message(parent, icon, title, message):
+    # Reuse one message box per kind instead of constructing a new one for every popup
+    box = _message_boxes.get((icon, title))
+    if box is None:
+        box = QMessageBox(icon, title, "", QMessageBox.Ok, parent)
+        _message_boxes[(icon, title)] = box
+    box.setText(message)
+    if not box.isVisible():
+        box.exec_()
+
+
+def _populate(menu, parent, spec):
+    # Build the actions from (label, slot, checkable) tuples and add them to the menu in one batch
+    actions = [QAction(label, parent, checkable=checkable) for label, _, checkable in spec]
+    for action, (_, slot, _) in zip(actions, spec):
+        action.triggered.connect(slot)
+    menu.addActions(actions)
+    return actions
 
 
 class AssistantsMenu:
-    def __init__(self, main_window):
+    # Bound methods are connected to Qt signals, so keep the instances weak-referenceable
+    __slots__ = ("main_window", "menu_bar", "assistants_menu", "function_config_manager", "assistant_client_manager", "assistantActions", "_dialog_cache", "_stale_dialog_types", "_export_dialog", "client_created_signal", "dialog", "__weakref__")
+
+    def __init__(self, main_window, menu_bar=None):
         self.main_window = main_window
-        self.assistants_menu = self.main_window.menuBar().addMenu("&Assistants")
-        self.function_config_manager = FunctionConfigManager.get_instance()
-        self.assistant_client_manager = AssistantClientManager.get_instance()
+        self.menu_bar = menu_bar or main_window.menuBar()
+        self.assistants_menu = self.menu_bar.addMenu("&Assistants")
+        self.function_config_manager = main_window.function_config_manager
+        self.assistant_client_manager = main_window.assistant_client_manager
+        self.assistantActions = []
+        self._dialog_cache = {}
+        self._stale_dialog_types = set()
+        self._export_dialog = None
+        self.client_created_signal = AssistantClientCreatedSignal()
+        self.client_created_signal.created_signal.connect(self.on_assistant_client_created)
         self.create_assistants_menu()
 
     def create_assistants_menu(self):
-        self.assistantActions = {}
-
-        createAssistantAction = QAction('Create New / Edit OpenAI Assistant', self.main_window)
-        createAssistantAction.triggered.connect(self.create_new_edit_assistant)
-        self.assistants_menu.addAction(createAssistantAction)
-
-        createChatAssistantAction = QAction('Create New / Edit Chat Assistant', self.main_window)
-        createChatAssistantAction.triggered.connect(self.create_new_edit_chat_assistant)
-        self.assistants_menu.addAction(createChatAssistantAction)
-
-        # Add an action for exporting an assistant
-        exportAction = QAction('Export', self.main_window)
-        exportAction.triggered.connect(self.export_assistant)
-        self.assistants_menu.addAction(exportAction)
+        spec = [
+            ('Create New / Edit OpenAI Assistant', self.create_new_edit_assistant, False),
+            ('Create New / Edit Chat Assistant', self.create_new_edit_chat_assistant, False),
+            ('Export', self.export_assistant, False),
+        ]
+        self.assistantActions = _populate(self.assistants_menu, self.main_window, spec)
 
     def create_new_edit_assistant(self):
-        self.dialog = AssistantConfigDialog(parent=self.main_window, function_config_manager=self.function_config_manager)
-        
-        # Connect the custom signal to a method to process the submitted data
-        self.dialog.assistantConfigSubmitted.connect(self.on_assistant_config_submitted)
-        
-        # Show the dialog non-modally
-        self.dialog.show()
+        self.show_assistant_config_dialog(ASSISTANT_TYPE)
 
     def create_new_edit_chat_assistant(self):
-        self.dialog = AssistantConfigDialog(parent=self.main_window, assistant_type="chat_assistant", function_config_manager=self.function_config_manager)
-        
-        # Connect the custom signal to a method to process the submitted data
-        self.dialog.assistantConfigSubmitted.connect(self.on_assistant_config_submitted)
-        
+        self.show_assistant_config_dialog(CHAT_ASSISTANT_TYPE)
+
+    def on_function_configs_changed(self):
+        # Dialogs created before the function configs were reloaded are replaced the next time they are opened
+        self._stale_dialog_types.update(self._dialog_cache)
+
+    def show_assistant_config_dialog(self, assistant_type):
+        # Bring an open dialog of the assistant type to the front, unless the function configs have been reloaded since it was created.
+        # A closed dialog is replaced, so the form starts from a new assistant with no state left from the last edit
+        dialog = self._dialog_cache.get(assistant_type)
+        if dialog is None or not dialog.isVisible() or assistant_type in self._stale_dialog_types:
+            if dialog is not None:
+                dialog.close()
+                dialog.deleteLater()
+            self._stale_dialog_types.discard(assistant_type)
+            dialog = AssistantConfigDialog(parent=self.main_window, assistant_type=assistant_type, function_config_manager=self.function_config_manager)
+
+            # Connect the custom signal to a method to process the submitted data
+            dialog.assistantConfigSubmitted.connect(self.on_assistant_config_submitted)
+            self._dialog_cache[assistant_type] = dialog
+        self.dialog = dialog
+
         # Show the dialog non-modally
         self.dialog.show()
+        self.dialog.raise_()
+        self.dialog.activateWindow()
 
     def on_assistant_config_submitted(self, assistant_config_json, ai_client_type, assistant_type):
+        # Creating the client calls the service, so keep it off the GUI thread
+        self.main_window.executor.submit(self.create_assistant_client, assistant_config_json, ai_client_type, assistant_type)
+
+    def create_assistant_client(self, assistant_config_json, ai_client_type, assistant_type):
+        try:
+            builder = _CLIENT_BUILDERS.get(assistant_type, AssistantClient.from_json)
+            assistant_client = builder(assistant_config_json, self.main_window, self.main_window.connection_timeout)
+            self.client_created_signal.created_signal.emit(assistant_client, ai_client_type)
+        except Exception as e:
+            self.main_window.signals.error.emit(f"An error occurred while creating/updating the assistant: {e}")
+
+    def on_assistant_client_created(self, assistant_client, ai_client_type):
         try:
-            if assistant_type == "chat_assistant":
-                assistant_client = ChatAssistantClient.from_json(assistant_config_json, self.main_window, self.main_window.connection_timeout)
-            else:
-                assistant_client = AssistantClient.from_json(assistant_config_json, self.main_window, self.main_window.connection_timeout)
             self.assistant_client_manager.register_client(assistant_client.name, assistant_client)
-            client_type = AIClientType[ai_client_type]
-            self.main_window.conversation_sidebar.load_assistant_list(client_type)
+            self.main_window.conversation_sidebar.load_assistant_list(_CLIENT_TYPE_BY_NAME[ai_client_type])
             self.dialog.update_assistant_combobox()
         except Exception as e:
-            QMessageBox.warning(self.main_window, "Error", f"An error occurred while creating/updating the assistant: {e}")
+            _show_message(self.main_window, QMessageBox.Warning, "Error", f"An error occurred while creating/updating the assistant: {e}")
 
     def export_assistant(self):
-        dialog = ExportAssistantDialog()
-        dialog.exec_()
+        if self._export_dialog is None:
+            self._export_dialog = ExportAssistantDialog()
+        else:
+            self._export_dialog.reset()
+        self._export_dialog.exec_()
 
 
 class FunctionsMenu:
-    def __init__(self, main_window):
+    __slots__ = ("main_window", "funtionsMenu", "__weakref__")
+
+    def __init__(self, main_window, menu_bar=None):
         self.main_window = main_window
-        self.funtionsMenu = self.main_window.menuBar().addMenu('&Functions')
+        menu_bar = menu_bar or main_window.menuBar()
+        self.funtionsMenu = menu_bar.addMenu('&Functions')
         self.setup_functions_menu()
 
     def setup_functions_menu(self):
-        createFunctionAction = QAction('Create New/Edit', self.main_window)
-        createFunctionAction.triggered.connect(lambda: self.create_function())
-        self.funtionsMenu.addAction(createFunctionAction)
-        editErrorMessagesAction = QAction('Error Categories', self.main_window)
-        editErrorMessagesAction.triggered.connect(lambda: self.edit_error_messages())
-        self.funtionsMenu.addAction(editErrorMessagesAction)
+        spec = [
+            ('Create New/Edit', self.create_function, False),
+            ('Error Categories', self.edit_error_messages, False),
+        ]
+        _populate(self.funtionsMenu, self.main_window, spec)
 
     def edit_error_messages(self):
+        from gui.function_dialogs import FunctionErrorsDialog
         editor = FunctionErrorsDialog(self.main_window)
         editor.show()
 
     def create_function(self):
+        from gui.function_dialogs import CreateFunctionDialog
         dialog = CreateFunctionDialog(self.main_window)
         dialog.show()
 
 
 class DiagnosticsMenu:
-    def __init__(self, main_window):
+    __slots__ = ("main_window", "diagnosticsMenu", "debugViewDialog", "broadcaster", "__weakref__")
+
+    def __init__(self, main_window, menu_bar=None):
         self.main_window = main_window
-        self.diagnosticsMenu = self.main_window.menuBar().addMenu('&Diagnostics')
+        menu_bar = menu_bar or main_window.menuBar()
+        self.diagnosticsMenu = menu_bar.addMenu('&Diagnostics')
         self.debugViewDialog = None
         self.broadcaster = None
         self.setup_menu()
 
     def setup_menu(self):
-        # Action for function diagnostics
-        diagAction = QAction("Run View", self.main_window, checkable=True)
-        diagAction.triggered.connect(self.toggle_diagnostics_sidebar)
-        self.diagnosticsMenu.addAction(diagAction)
-
-        debugViewAction = QAction("Debug View", self.main_window)
-        debugViewAction.triggered.connect(self.show_debug_view)
-        self.diagnosticsMenu.addAction(debugViewAction)
+        spec = [
+            # Action for function diagnostics
+            ("Run View", self.toggle_diagnostics_sidebar, True),
+            ("Debug View", self.show_debug_view, False),
+        ]
+        _populate(self.diagnosticsMenu, self.main_window, spec)
 
     def toggle_diagnostics_sidebar(self, state):
         self.main_window.diagnostics_sidebar.setVisible(not self.main_window.diagnostics_sidebar.isVisible())
 
     def show_debug_view(self):
         if not self.debugViewDialog:
+            from gui.debug_dialog import DebugViewDialog
             self.broadcaster = LogBroadcaster()
             self.debugViewDialog = DebugViewDialog(self.broadcaster, self.main_window)
-            add_broadcaster_to_logger(self.broadcaster)
+            self.debugViewDialog.finished.connect(self.on_debug_view_closed)
+            # Attach the broadcaster to the loggers after the dialog has been painted
+            QTimer.singleShot(0, lambda: add_broadcaster_to_logger(self.broadcaster))
+        # Broadcast log messages only while the debug view is open
+        self.broadcaster.set_enabled(True)
         self.debugViewDialog.show()
         self.debugViewDialog.raise_()
         self.debugViewDialog.activateWindow()
 
+    def on_debug_view_closed(self, result):
+        self.broadcaster.set_enabled(False)
+
 
 class SettingsMenu:
-    def __init__(self, main_window):
+    __slots__ = ("main_window", "settingsMenu", "debugViewDialog", "broadcaster", "__weakref__")
+
+    def __init__(self, main_window, menu_bar=None):
         self.main_window = main_window
-        self.settingsMenu = self.main_window.menuBar().addMenu('&Settings')
+        menu_bar = menu_bar or main_window.menuBar()
+        self.settingsMenu = menu_bar.addMenu('&Settings')
         self.debugViewDialog = None
         self.broadcaster = None
         self.setup_menu()
 
     def setup_menu(self):
-        chatSettingsAction = QAction("System Assistants", self.main_window)
-        chatSettingsAction.triggered.connect(lambda: self.show_client_settings())
-        self.settingsMenu.addAction(chatSettingsAction)
-
-        # General settings
-        generalSettingsAction = QAction("General", self.main_window)
-        generalSettingsAction.triggered.connect(lambda: self.show_general_settings())
-        self.settingsMenu.addAction(generalSettingsAction)
+        spec = [
+            ("System Assistants", self.show_client_settings, False),
+            # General settings
+            ("General", self.show_general_settings, False),
+        ]
+        _populate(self.settingsMenu, self.main_window, spec)
 
     def show_client_settings(self):
+        from gui.settings_dialogs import ClientSettingsDialog
         dialog = ClientSettingsDialog(self.main_window)
         if dialog.exec_() == QDialog.Accepted:
             try:
                 self.main_window.init_system_assistant_settings()
                 self.main_window.init_system_assistants()
             except Exception as e:
-                QMessageBox.warning(self.main_window, "Error", f"An error occurred while updating the settings: {e}")
+                _show_message(self.main_window, QMessageBox.Warning, "Error", f"An error occurred while updating the settings: {e}")
 
     def show_general_settings(self):
+        from gui.settings_dialogs import GeneralSettingsDialog
         dialog = GeneralSettingsDialog(self.main_window)
         dialog.show()
 
 
 class TasksMenu:
-    def __init__(self, main_window):
+    __slots__ = ("main_window", "tasksMenu", "__weakref__")
+
+    def __init__(self, main_window, menu_bar=None):
         self.main_window = main_window
-        self.tasksMenu = self.main_window.menuBar().addMenu('&Tasks')
+        menu_bar = menu_bar or main_window.menuBar()
+        self.tasksMenu = menu_bar.addMenu('&Tasks')
         self.setup_tasks_menu()
 
     def setup_tasks_menu(self):
-        # Action for editing error messages
-        createTaskAction = QAction('Create New/Edit', self.main_window)
-        createTaskAction.triggered.connect(lambda: self.create_task())
-        self.tasksMenu.addAction(createTaskAction)
-        # Action for schedule task
-        scheduleTaskAction = QAction('Schedule', self.main_window)
-        scheduleTaskAction.triggered.connect(lambda: self.schedule_task())
-        self.tasksMenu.addAction(scheduleTaskAction)
-        # Action for Show Tasks
-        showTasksAction = QAction('View', self.main_window)
-        showTasksAction.triggered.connect(lambda: self.show_scheduled_tasks())
-        self.tasksMenu.addAction(showTasksAction)
+        spec = [
+            ('Create New/Edit', self.create_task, False),
+            ('Schedule', self.schedule_task, False),
+            ('View', self.show_scheduled_tasks, False),
+        ]
+        _populate(self.tasksMenu, self.main_window, spec)
 
     def create_task(self):
+        from gui.task_dialogs import CreateTaskDialog
         dialog = CreateTaskDialog(self.main_window, self.main_window.task_manager)
         dialog.show()
 
     def schedule_task(self):
+        from gui.task_dialogs import ScheduleTaskDialog
         dialog = ScheduleTaskDialog(self.main_window, self.main_window.task_manager)
         dialog.show()
 
     def show_scheduled_tasks(self):
         # Show not implemented dialog
-        QMessageBox.information(self.main_window, "Not Implemented", "This feature is not implemented yet.")
+        _show_message(self.main_window, QMessageBox.Information, "Not Implemented", "This feature is not implemented yet.")
         #dialog = ShowScheduledTasksDialog(self.main_window)
         #dialog.show()
\ No newline at end of file
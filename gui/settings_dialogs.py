@@ -4,12 +4,41 @@
 # This software uses the PySide6 library, which is licensed under the GNU Lesser General Public License (LGPL).
 # For more details on PySide6's license, see <https://www.qt.io/licensing>
 
-from PySide6.QtWidgets import QDialog, QVBoxLayout, QLineEdit, QLabel, QPushButton, QComboBox, QMessageBox, QHBoxLayout, QCheckBox
+from PySide6.QtWidgets import QDialog, QVBoxLayout, QLineEdit, QLabel, QPushButton, QComboBox, QMessageBox, QHBoxLayout, QCheckBox, QLayout
+from PySide6.QtCore import Qt, Signal
 
-import os, json
+import os, json, time
 
 from azure.ai.assistant.management.ai_client_factory import AIClientType, AIClientFactory
 
+_AI_CLIENT_TYPE_NAMES = tuple(client_type.name for client_type in AIClientType)
+_AI_CLIENT_TYPE_BY_NAME = {client_type.name: client_type for client_type in AIClientType}
+
+# Parsed settings files by path, together with the modification time they were read at
+_SETTINGS_CACHE = {}
+
+# Model ids by (AI client type, API version), together with the time they were fetched at
+_MODELS_CACHE = {}
+_MODELS_CACHE_TTL = 300
+
+# Start of the obscured key text shown for API keys read from the environment
+_OBSCURED_KEY_PREFIX = '*' * 7
+
+
+def _add_rows(layout, *items):
+    # Add widgets and nested layouts to the layout in the given order
+    for item in items:
+        if isinstance(item, QLayout):
+            layout.addLayout(item)
+        else:
+            layout.addWidget(item)
+
+
+def _line_edit(placeholder):
+    line_edit = QLineEdit()
+    line_edit.setPlaceholderText(placeholder)
+    return line_edit
+
 
 class GeneralSettingsDialog(QDialog):
     def __init__(self, parent=None):
@@ -51,15 +80,18 @@ class GeneralSettingsDialog(QDialog):
         self.buttonsLayout.addWidget(self.cancelButton)
 
         # Adding layouts to the main layout
-        self.layout.addLayout(self.connectionTimeoutLayout)
-        self.layout.addWidget(self.useStreamingForAssistantCheckbox)
-        self.layout.addWidget(self.useSystemAssistantForThreadsCheckbox)
-        self.layout.addWidget(self.useTextSummarizationCheckbox)
-        self.layout.addLayout(self.buttonsLayout)
+        _add_rows(
+            self.layout,
+            self.connectionTimeoutLayout,
+            self.useStreamingForAssistantCheckbox,
+            self.useSystemAssistantForThreadsCheckbox,
+            self.useTextSummarizationCheckbox,
+            self.buttonsLayout
+        )
 
         # Connect signals
-        self.okButton.clicked.connect(self.accept)
-        self.cancelButton.clicked.connect(self.reject)
+        self.okButton.clicked.connect(self.accept, Qt.DirectConnection)
+        self.cancelButton.clicked.connect(self.reject, Qt.DirectConnection)
 
     def accept(self):
         try:
@@ -74,10 +106,24 @@ class GeneralSettingsDialog(QDialog):
             QMessageBox.warning(self, "Invalid Input", "Please enter valid numbers for the timeouts.")
 
 
+class ModelComboBox(QComboBox):
+    popupAboutToShow = Signal()
+
+    def showPopup(self):
+        self.popupAboutToShow.emit()
+        super().showPopup()
+
+
 class ClientSettingsDialog(QDialog):
+    modelsFetched = Signal(object, list)
+    modelsFetchFailed = Signal(object, str)
+
     def __init__(self, main_window):
         super(ClientSettingsDialog, self).__init__(main_window)
         self.main_window = main_window
+        # The models are fetched on a worker thread
+        self.modelsFetched.connect(self.on_models_fetched, Qt.QueuedConnection)
+        self.modelsFetchFailed.connect(self.on_models_fetch_failed, Qt.QueuedConnection)
         self.init_settings()
         self.init_ui()
 
@@ -96,62 +142,65 @@ class ClientSettingsDialog(QDialog):
 
         # Client Selection Label
         self.clientSelectionLabel = QLabel("Select AI client for System Assistants:")
-        self.layout.addWidget(self.clientSelectionLabel)
 
         # Create combo box for client selection
         self.clientSelection = QComboBox()
-        ai_client_type_names = [client_type.name for client_type in AIClientType]
-        self.clientSelection.addItems(ai_client_type_names)
-        self.layout.addWidget(self.clientSelection)
+        self.clientSelection.addItems(_AI_CLIENT_TYPE_NAMES)
         # Connect the client selection change signal to the slot
         self.clientSelection.currentIndexChanged.connect(self.update_model_selection)
 
-        # OpenAI API Key
-        self.openai_api_key_input = QLineEdit()
-        self.openai_api_key_input.setPlaceholderText("Enter your OpenAI API key")
-        self.layout.addWidget(QLabel("OpenAI API Key:"))
-        self.layout.addWidget(self.openai_api_key_input)
-
-        # Azure OpenAI API Key
-        self.azure_api_key_input = QLineEdit()
-        self.azure_api_key_input.setPlaceholderText("Enter your Azure OpenAI API key")
-        self.layout.addWidget(QLabel("Azure OpenAI API Key:"))
-        self.layout.addWidget(self.azure_api_key_input)
-
-        # Azure Endpoint
-        self.azure_endpoint_input = QLineEdit()
-        self.azure_endpoint_input.setPlaceholderText("Enter your Azure OpenAI Endpoint")
-        self.layout.addWidget(QLabel("Azure OpenAI Endpoint:"))
-        self.layout.addWidget(self.azure_endpoint_input)
-
-        # Azure API Version
-        self.azure_api_version_input = QLineEdit()
-        self.azure_api_version_input.setPlaceholderText("Enter your Azure OpenAI API Version")
-        self.layout.addWidget(QLabel("Azure OpenAI API Version:"))
-        self.layout.addWidget(self.azure_api_version_input)
+        # API keys, endpoint and API version
+        self.openai_api_key_input = _line_edit("Enter your OpenAI API key")
+        self.azure_api_key_input = _line_edit("Enter your Azure OpenAI API key")
+        self.azure_endpoint_input = _line_edit("Enter your Azure OpenAI Endpoint")
+        self.azure_api_version_input = _line_edit("Enter your Azure OpenAI API Version")
 
         # Model selection
-        self.model_selection = QComboBox()
+        self.model_selection = ModelComboBox()
         self.model_selection.setEditable(True)
         self.model_selection.toolTip = "Select the model to use for the system assistant, e.g. for function generation"
-        ai_client_type = AIClientType[self.clientSelection.currentText()]
-        self.layout.addWidget(QLabel("Model for System Assistants:"))
-        self.layout.addWidget(self.model_selection)
 
         # Apply Button
         self.applyButton = QPushButton("Apply")
-        self.applyButton.clicked.connect(self.apply_settings)
-        self.layout.addWidget(self.applyButton)
-
-        # Set initial states based on settings
-        self.set_initial_states()
+        self.applyButton.clicked.connect(self.apply_settings, Qt.DirectConnection)
+
+        _add_rows(
+            self.layout,
+            self.clientSelectionLabel, self.clientSelection,
+            QLabel("OpenAI API Key:"), self.openai_api_key_input,
+            QLabel("Azure OpenAI API Key:"), self.azure_api_key_input,
+            QLabel("Azure OpenAI Endpoint:"), self.azure_endpoint_input,
+            QLabel("Azure OpenAI API Version:"), self.azure_api_version_input,
+            QLabel("Model for System Assistants:"), self.model_selection,
+            self.applyButton
+        )
+
+        # The models are fetched from the service only when the model list is opened
+        self.model_selection.popupAboutToShow.connect(self.populate_models)
+        self.pending_model_client = None
+        self.fetching_model_client = None
+        self.initial_states_set = False
+
+    def showEvent(self, event):
+        # Set initial states based on settings when the dialog is first shown
+        if not self.initial_states_set:
+            self.initial_states_set = True
+            self.set_initial_states()
+        super(ClientSettingsDialog, self).showEvent(event)
 
     def load_settings(self):
         """ Load settings from JSON file. """
-        if os.path.exists(self.file_path):
+        try:
+            mtime = os.stat(self.file_path).st_mtime_ns
+        except FileNotFoundError:
+            return
+        cached = _SETTINGS_CACHE.get(self.file_path)
+        if cached is None or cached[0] != mtime:
             with open(self.file_path, 'r') as file:
                 loaded_settings = json.load(file)
-                self.settings.update(loaded_settings)
+            cached = (mtime, loaded_settings)
+            _SETTINGS_CACHE[self.file_path] = cached
+        self.settings.update(cached[1])
 
     def set_initial_states(self):
         ai_client_type = self.settings.get("ai_client_type", AIClientType.AZURE_OPEN_AI.name)
@@ -162,7 +211,7 @@ class ClientSettingsDialog(QDialog):
             api_version = None
 
         # Fill the model selection
-        self.fill_client_model_selection(AIClientType[ai_client_type], api_version)
+        self.fill_client_model_selection(_AI_CLIENT_TYPE_BY_NAME[ai_client_type], api_version)
 
         # Set the API keys and endpoint values from environment variables
         self.set_key_input_value(self.openai_api_key_input, "OPENAI_API_KEY")
@@ -188,29 +237,59 @@ class ClientSettingsDialog(QDialog):
         # Clear existing items in model_selection
         self.model_selection.clear()
 
-        try:
-            if ai_client_type == AIClientType.OPEN_AI:
-                # Get the AI client instance, pass the api_version if it's set
-                ai_client = AIClientFactory.get_instance().get_client(ai_client_type, api_version)
-                # Fetch and add new models to the model_selection
-                if ai_client:
-                    models = ai_client.models.list().data
-                    for model in models:
-                        self.model_selection.addItem(model.id)
-            elif ai_client_type == AIClientType.AZURE_OPEN_AI:
-                models = []
-
-            # Set the default model
-            default_model = self.settings.get("model", "")
-            if default_model:
-                self.model_selection.setCurrentText(default_model)
+        # Defer fetching the models until the model list is opened
+        if ai_client_type == AIClientType.OPEN_AI:
+            self.pending_model_client = (ai_client_type, api_version)
+        else:
+            self.pending_model_client = None
+
+        # Set the default model
+        default_model = self.settings.get("model", "")
+        if default_model:
+            self.model_selection.setCurrentText(default_model)
+
+    def populate_models(self):
+        if self.pending_model_client is None or self.fetching_model_client == self.pending_model_client:
+            return
+        cached = _MODELS_CACHE.get(self.pending_model_client)
+        if cached is not None and time.monotonic() - cached[0] < _MODELS_CACHE_TTL:
+            self.on_models_fetched(self.pending_model_client, cached[1])
+            return
+        # Fetch the models in the background, the list is filled when they arrive
+        self.fetching_model_client = self.pending_model_client
+        self.main_window.executor.submit(self.fetch_models, self.fetching_model_client)
 
+    def fetch_models(self, model_client):
+        ai_client_type, api_version = model_client
+        try:
+            # Get the AI client instance, pass the api_version if it's set
+            ai_client = AIClientFactory.get_instance().get_client(ai_client_type, api_version)
+            model_ids = [model.id for model in ai_client.models.list().data] if ai_client else []
+            _MODELS_CACHE[model_client] = (time.monotonic(), model_ids)
+            self.modelsFetched.emit(model_client, model_ids)
         except Exception as e:
-            QMessageBox.warning(self, "Warning", f"Failed to fill model selection: {e}")
+            self.modelsFetchFailed.emit(model_client, str(e))
+
+    def on_models_fetched(self, model_client, model_ids):
+        self.fetching_model_client = None
+        # Ignore the result if another client has been selected meanwhile
+        if model_client != self.pending_model_client:
+            return
+        self.pending_model_client = None
+        current_model = self.model_selection.currentText()
+        self.model_selection.blockSignals(True)
+        self.model_selection.addItems(model_ids)
+        self.model_selection.setCurrentText(current_model)
+        self.model_selection.blockSignals(False)
+
+    def on_models_fetch_failed(self, model_client, error_message):
+        self.fetching_model_client = None
+        if model_client == self.pending_model_client:
+            QMessageBox.warning(self, "Warning", f"Failed to fill model selection: {error_message}")
 
     def update_model_selection(self):
         # Get the current AI client type
-        ai_client_type = AIClientType[self.clientSelection.currentText()]
+        ai_client_type = _AI_CLIENT_TYPE_BY_NAME[self.clientSelection.currentText()]
 
         # Determine the API version for Azure OpenAI, if needed
         api_version = None
@@ -221,19 +300,24 @@ class ClientSettingsDialog(QDialog):
         self.fill_client_model_selection(ai_client_type, api_version)
 
     def set_key_input_value(self, input_field, env_var):
-        key = os.getenv(env_var, "")
-        if key:
-            # Obscure all but the last 4 characters of the key
-            obscured_key = '*' * (len(key) - 4) + key[-4:]
-            input_field.setText(obscured_key)
+        key = os.environ.get(env_var)
+        if not key:
+            return
+        # Obscure all but the last 4 characters of the key
+        obscured_key = '*' * max(len(key) - 4, 0) + key[-4:]
+        input_field.setText(obscured_key)
 
     def apply_settings(self):
         ai_client_type = self.clientSelection.currentText()
+        openai_api_key = self.openai_api_key_input.text()
+        azure_api_key = self.azure_api_key_input.text()
+        azure_endpoint = self.azure_endpoint_input.text()
+
         # Check for empty required fields
-        if ai_client_type == AIClientType.OPEN_AI and not self.openai_api_key_input.text():
+        if ai_client_type == AIClientType.OPEN_AI.name and not openai_api_key:
             QMessageBox.critical(self, "Error", "OpenAI API Key is required when applying OpenAI settings.")
             return
-        elif ai_client_type == AIClientType.AZURE_OPEN_AI and (not self.azure_api_key_input.text() or not self.azure_endpoint_input.text()):
+        elif ai_client_type == AIClientType.AZURE_OPEN_AI.name and (not azure_api_key or not azure_endpoint):
             QMessageBox.critical(self, "Error", "Azure OpenAI API Key and Endpoint are required when applying Azure OpenAI settings.")
             return
 
@@ -243,19 +327,22 @@ class ClientSettingsDialog(QDialog):
             "api_version": self.azure_api_version_input.text()
         }
 
-        # Save the API keys and endpoint to environment variables
-        self.save_environment_variable("OPENAI_API_KEY", self.openai_api_key_input.text())
-        self.save_environment_variable("AZURE_OPENAI_API_KEY", self.azure_api_key_input.text())
-        self.save_environment_variable("AZURE_OPENAI_ENDPOINT", self.azure_endpoint_input.text())
+        # Save the API keys and endpoint to environment variables, obscured keys are left as they are
+        for var_name, value in (("OPENAI_API_KEY", openai_api_key), ("AZURE_OPENAI_API_KEY", azure_api_key), ("AZURE_OPENAI_ENDPOINT", azure_endpoint)):
+            if value and not value.startswith(_OBSCURED_KEY_PREFIX):
+                # Models fetched with the previous credentials may no longer apply
+                if os.environ.get(var_name) != value:
+                    _MODELS_CACHE.clear()
+                os.environ[var_name] = value
 
         # Save the settings to file
-        self.save_settings(json.dumps(settings, indent=4))
+        self.save_settings(settings)
         self.accept()
 
-    def save_environment_variable(self, var_name, value):
-        if value and not value.startswith('*******'):
-            os.environ[var_name] = value
-
-    def save_settings(self, settings_json : str):
-        with open(self.file_path, 'w') as file:
-            file.write(settings_json)
+    def save_settings(self, settings : dict):
+        # Write to a temporary file and replace the settings file with it so a failed write cannot truncate it
+        temp_file_path = self.file_path + ".tmp"
+        with open(temp_file_path, 'w') as file:
+            json.dump(settings, file, indent=4)
+        os.replace(temp_file_path, self.file_path)
+        _SETTINGS_CACHE[self.file_path] = (os.stat(self.file_path).st_mtime_ns, settings)
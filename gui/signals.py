@@ -4,12 +4,63 @@
 # This software uses the PySide6 library, which is licensed under the GNU Lesser General Public License (LGPL).
 # For more details on PySide6's license, see <https://www.qt.io/licensing>
 
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QObject, Signal, Qt, QTimer
+
+import threading
 
 from gui.status_bar import ActivityStatus
 
-class AppendConversationSignal(QObject):
-    update_signal = Signal(str, str, str)
+class GuiSignals(QObject):
+    # Signals of the main window, held by a single QObject
+    append_conversation = Signal(str, str, str)
+    speech_hypothesis = Signal(str)
+    speech_final = Signal(str)
+    speech_synthesis_complete = Signal()
+    start_animation = Signal(ActivityStatus)
+    stop_animation = Signal(ActivityStatus)
+    start_processing = Signal(str, bool)
+    stop_processing = Signal(str, bool)
+    update_conversation_title = Signal(str, str)
+    error = Signal(str)
+    conversation_view_clear = Signal()
+    conversation_append_messages = Signal(list)
+    conversation_append_image = Signal(str)
+    function_configs_changed = Signal()
+
+class ConversationChunkBuffer(QObject):
+    # Coalesces streamed message chunks so that the conversation view is updated once per interval
+    append_signal = Signal(str, str, bool)
+    chunks_pending = Signal()
+
+    def __init__(self, interval=30):
+        super().__init__()
+        self.interval = interval
+        self.chunks = []
+        self.lock = threading.Lock()
+        self.chunks_pending.connect(self.schedule_flush, Qt.QueuedConnection)
+
+    def queue(self, sender, chunk, is_start_of_message):
+        with self.lock:
+            is_first_pending = not self.chunks
+            self.chunks.append((sender, chunk, is_start_of_message))
+        if is_first_pending:
+            self.chunks_pending.emit()
+
+    def schedule_flush(self):
+        QTimer.singleShot(self.interval, self.flush)
+
+    def flush(self):
+        with self.lock:
+            chunks, self.chunks = self.chunks, []
+        # Join the consecutive chunks of the same message
+        merged = []
+        for sender, chunk, is_start_of_message in chunks:
+            if merged and not is_start_of_message and merged[-1][0] == sender:
+                merged[-1][1].append(chunk)
+            else:
+                merged.append((sender, [chunk], is_start_of_message))
+        for sender, message_chunks, is_start_of_message in merged:
+            self.append_signal.emit(sender, "".join(message_chunks), is_start_of_message)
 
 class UserInputSignal(QObject):
     update_signal = Signal(str)
@@ -17,36 +68,12 @@ class UserInputSignal(QObject):
 class UserInputSendSignal(QObject):
     send_signal = Signal(str)
 
-class SpeechSynthesisCompleteSignal(QObject):
-    complete_signal = Signal()
-
-class ConversationViewClear(QObject):
-    update_signal = Signal()
-
-class ConversationAppendMessagesSignal(QObject):
-    append_signal = Signal(list)
-
-class ConversationAppendImageSignal(QObject):
-    append_signal = Signal(str)
-
-class ConversationAppendChunkSignal(QObject):
-    append_signal = Signal(str, str, bool)
-
 class StartStatusAnimationSignal(QObject):
     start_signal = Signal(ActivityStatus)
 
 class StopStatusAnimationSignal(QObject):
     stop_signal = Signal(ActivityStatus)
 
-class StartProcessingSignal(QObject):
-    start_signal = Signal(str, bool)
-
-class StopProcessingSignal(QObject):
-    stop_signal = Signal(str, bool)
-
-class UpdateConversationTitleSignal(QObject):
-    update_signal = Signal(str, str)
-
 class DiagnosticStartRunSignal(QObject):
     # Define a signal that carries assistant name, run identifier, run start time and user input
     start_signal = Signal(str, str, str, str)
@@ -62,3 +89,7 @@ class DiagnosticEndRunSignal(QObject):
 class ErrorSignal(QObject):
     # Define a signal that carries error message
     error_signal = Signal(str)
+
+class AssistantClientCreatedSignal(QObject):
+    # Define a signal that carries the created assistant client and AI client type name
+    created_signal = Signal(object, str)
@@ -5,19 +5,24 @@
 # For more details on PySide6's license, see <https://www.qt.io/licensing>
 
 from PySide6.QtWidgets import QMessageBox
-import azure.cognitiveservices.speech as speechsdk
 
-import os, time
+import os, time, logging, threading
 
 from azure.ai.assistant.management.logger_module import logger
 from gui.status_bar import ActivityStatus
 
+# The Speech SDK is imported when the first handler is created with speech credentials
+speechsdk = None
+
 
 class SpeechInputHandler:
     def __init__(self, main_window, update_signal=None, send_signal=None):
         self.main_window = main_window
         self.update_signal = update_signal
         self.send_signal = send_signal
+        # Bound emitters used by the recognition callbacks
+        self.emit_update = update_signal.emit if update_signal else None
+        self.emit_send = send_signal.emit if send_signal else None
         self.is_initialized = False
         self.is_listening = False
 
@@ -28,7 +33,10 @@ class SpeechInputHandler:
             logger.error("AZURE_AI_SPEECH_KEY or AZURE_AI_SPEECH_REGION environment variables not found.")
             return
 
+        global speechsdk
         try:
+            if speechsdk is None:
+                import azure.cognitiveservices.speech as speechsdk
             self.speech_config = speechsdk.SpeechConfig(subscription=speech_key, region=speech_region)
             self.speech_config.set_property(speechsdk.PropertyId.Speech_SegmentationSilenceTimeoutMs, "1000")
             self.speech_recognizer = speechsdk.SpeechRecognizer(speech_config=self.speech_config)
@@ -39,29 +47,37 @@ class SpeechInputHandler:
 
             self.user_input = ""
             self.user_consent_obtained = False
-            if self.speech_config:
-                self.is_initialized = True
+            self.is_initialized = True
         except Exception as e:
             logger.error("Error initializing speech input handler: {}".format(e))
 
     def recognizing_cb(self, evt):
-        if evt.result.reason == speechsdk.ResultReason.RecognizingSpeech:
-            self.user_input = evt.result.text
-            logger.info('Recognizing: {}'.format(evt.result.text))
-            # if text is empty, do not send signal
-            if evt.result.text.strip() != "" and self.is_listening and self.update_signal:
-                self.update_signal.emit(evt.result.text)
+        # Called for every interim result, so return before any string work when the result is not used
+        if not self.is_listening or not self.emit_update:
+            return
+        if evt.result.reason != speechsdk.ResultReason.RecognizingSpeech:
+            return
+        text = evt.result.text
+        self.user_input = text
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"Recognizing: {text}")
+        # if text is empty, do not send signal
+        if text.strip():
+            self.emit_update(text)
 
     def recognized_cb(self, evt):
-        if evt.result.reason == speechsdk.ResultReason.RecognizedSpeech:
-            self.user_input = evt.result.text
-            logger.info('Recognized: {}'.format(evt.result.text))
-            # if text is empty, do not send signal
-            if evt.result.text.strip() != "" and self.is_listening:
-                if self.update_signal:
-                    self.update_signal.emit(evt.result.text)
-                if self.send_signal:
-                    self.send_signal.emit(evt.result.text)
+        if not self.is_listening or evt.result.reason != speechsdk.ResultReason.RecognizedSpeech:
+            return
+        text = evt.result.text
+        self.user_input = text
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"Recognized: {text}")
+        # if text is empty, do not send signal
+        if text.strip():
+            if self.emit_update:
+                self.emit_update(text)
+            if self.emit_send:
+                self.emit_send(text)
 
     def stop_cb(self, evt):
         logger.info('Closing on {}'.format(evt))
@@ -84,21 +100,33 @@ class SpeechInputHandler:
             # Proceed with starting the microphone listening as consent is given or already obtained
             logger.info("Starting recognition from microphone.")
             start_time = time.time()
-            if hasattr(self.main_window, 'start_animation_signal'):
-                self.main_window.start_animation_signal.start_signal.emit(ActivityStatus.LISTENING)
-            self.speech_recognizer.start_continuous_recognition_async().get()
-            stop_time = time.time()
-            logger.info(f"Time taken for speech recognition to start: {stop_time - start_time} seconds")
+            if hasattr(self.main_window, 'signals'):
+                self.main_window.signals.start_animation.emit(ActivityStatus.LISTENING)
             self.is_listening = True  # Set flag to indicate listening has started
+            # Do not block the caller while the recognizer starts, wait for it in the background instead
+            start_future = self.speech_recognizer.start_continuous_recognition_async()
+            threading.Thread(target=self.wait_for_recognition_start, args=(start_future, start_time), daemon=True).start()
             return True
 
+    def wait_for_recognition_start(self, start_future, start_time):
+        try:
+            start_future.get()
+            stop_time = time.time()
+            logger.info(f"Time taken for speech recognition to start: {stop_time - start_time} seconds")
+        except Exception as e:
+            logger.error(f"Error starting speech recognition: {e}")
+            # The recognizer did not start, so do not keep acting as if it was listening
+            self.is_listening = False
+            if hasattr(self.main_window, 'signals'):
+                self.main_window.signals.stop_animation.emit(ActivityStatus.LISTENING)
+
     def stop_listening_from_mic(self):
         if self.is_listening:
             logger.info("Stopping recognition from microphone.")
             self.is_listening = False  # Reset flag to indicate not listening
             start_time = time.time()
-            if hasattr(self.main_window, 'stop_animation_signal'):
-                self.main_window.stop_animation_signal.stop_signal.emit(ActivityStatus.LISTENING)
+            if hasattr(self.main_window, 'signals'):
+                self.main_window.signals.stop_animation.emit(ActivityStatus.LISTENING)
             self.speech_recognizer.stop_continuous_recognition_async().get()
             stop_time = time.time()
             logger.info(f"Time taken for speech recognition to stop: {stop_time - start_time} seconds")
@@ -1,15 +1,17 @@
 # Copyright (c) Microsoft. All rights reserved.
 # Licensed under the MIT license. See LICENSE.md file in the project root for full license information.
 
-import azure.cognitiveservices.speech as speechsdk
-from azure.cognitiveservices.speech import ResultFuture
-
-import os, time
+import os, time, threading
 
 from azure.ai.assistant.management.logger_module import logger
 
+# The Speech SDK is imported when speech is first synthesized
+speechsdk = None
+
 
 class SpeechSynthesisHandler:
+    __slots__ = ("main_window", "complete_signal", "is_initialized", "speech_synthesizer", "synthesizer_lock", "pending_fillers", "speech_key", "speech_region", "speech_config", "__weakref__")
+
     def __init__(self, 
                  main_window,
                  complete_signal=None
@@ -17,35 +19,76 @@ class SpeechSynthesisHandler:
         self.main_window = main_window
         self.complete_signal = complete_signal
         self.is_initialized = False
-        speech_key = os.environ.get('AZURE_AI_SPEECH_KEY')
-        speech_region = os.environ.get('AZURE_AI_SPEECH_REGION')
+        self.speech_synthesizer = None
+        self.synthesizer_lock = threading.Lock()
+        # Number of queued filler utterances whose completion must not restart the microphone
+        self.pending_fillers = 0
+        self.speech_key = os.environ.get('AZURE_AI_SPEECH_KEY')
+        self.speech_region = os.environ.get('AZURE_AI_SPEECH_REGION')
 
-        if not speech_key or not speech_region:
+        if not self.speech_key or not self.speech_region:
             logger.error("AZURE_AI_SPEECH_KEY or AZURE_AI_SPEECH_REGION environment variables not found.")
             return
 
+        # The synthesizer is created on first use
+        self.is_initialized = True
+
+    def ensure_synthesizer(self):
+        global speechsdk
+        with self.synthesizer_lock:
+            if self.speech_synthesizer is not None:
+                return True
+            try:
+                if speechsdk is None:
+                    import azure.cognitiveservices.speech as speechsdk
+                self.speech_config = speechsdk.SpeechConfig(subscription=self.speech_key, region=self.speech_region)
+                self.speech_config.speech_synthesis_voice_name = "en-US-AriaNeural"
+                self.speech_synthesizer = speechsdk.SpeechSynthesizer(speech_config=self.speech_config)
+                self.speech_synthesizer.synthesis_completed.connect(self.synthesis_completed_cb)
+                self.speech_synthesizer.synthesis_canceled.connect(self.synthesis_canceled_cb)
+                return True
+            except Exception as e:
+                logger.error(f"Error initializing speech synthesis handler: {e}")
+                self.is_initialized = False
+                return False
+
+    def warm_up(self):
+        # Create the synthesizer and open its service connection ahead of the first reply,
+        # so the first synthesis does not pay for the connection setup
+        if not self.is_initialized or not self.ensure_synthesizer():
+            return
         try:
-            self.speech_config = speechsdk.SpeechConfig(subscription=speech_key, region=speech_region)
-            self.speech_config.speech_synthesis_voice_name = "en-US-AriaNeural"
-            self.speech_synthesizer = speechsdk.SpeechSynthesizer(speech_config=self.speech_config)
-            self.speech_synthesizer.synthesis_completed.connect(self.synthesis_completed_cb)
-            self.is_initialized = True
+            connection = speechsdk.Connection.from_speech_synthesizer(self.speech_synthesizer)
+            connection.open(True)
+            logger.debug("Speech synthesis connection opened")
         except Exception as e:
-            logger.error(f"Error initializing speech synthesis handler: {e}")
+            logger.warning(f"Error warming up speech synthesis: {e}")
 
     def synthesis_completed_cb(self, evt):
-        if evt.result.reason == speechsdk.ResultReason.SynthesizingAudioCompleted:
-            logger.info("Speech synthesis completed successfully.")
-        elif evt.result.reason == speechsdk.ResultReason.Canceled:
-            cancellation_details = evt.result.cancellation_details
-            logger.error(f"Speech synthesis canceled: {cancellation_details.reason}")
-            if cancellation_details.reason == speechsdk.CancellationReason.Error:
-                logger.error(f"Error details: {cancellation_details.error_details}")
+        logger.info("Speech synthesis completed successfully.")
+        if self.consume_pending_filler():
+            return
         if self.complete_signal:
             self.complete_signal.emit()
 
-    def synthesize_speech_async(self, text) -> ResultFuture:
-        if not self.is_initialized:
+    def synthesis_canceled_cb(self, evt):
+        # A filler stopped by cancel() or by a service error ends here instead of in synthesis_completed_cb
+        cancellation_details = evt.result.cancellation_details
+        logger.warning(f"Speech synthesis canceled: {cancellation_details.reason}")
+        if cancellation_details.reason == speechsdk.CancellationReason.Error:
+            logger.error(f"Error details: {cancellation_details.error_details}")
+        self.consume_pending_filler()
+
+    def consume_pending_filler(self):
+        # Utterances are synthesized in order, so a pending filler always ends before the reply queued after it
+        with self.synthesizer_lock:
+            if self.pending_fillers > 0:
+                self.pending_fillers -= 1
+                return True
+            return False
+
+    def synthesize_speech_async(self, text) -> "speechsdk.ResultFuture":
+        if not self.is_initialized or not self.ensure_synthesizer():
             logger.error("SpeechSynthesisHandler is not initialized properly.")
             return
 
@@ -56,4 +99,29 @@ class SpeechSynthesisHandler:
             logger.debug(f"Time taken for async speech synthesis to start: {stop_time - start_time} seconds")
             return result_future
         except Exception as e:
-            logger.error(f"Error during speech synthesis: {e}")
\ No newline at end of file
+            logger.error(f"Error during speech synthesis: {e}")
+
+    def synthesize_filler_async(self, text):
+        # Speaks a short phrase while the actual reply is still being prepared, without signaling completion
+        if not self.is_initialized or not self.ensure_synthesizer():
+            return
+        try:
+            with self.synthesizer_lock:
+                self.pending_fillers += 1
+            self.speech_synthesizer.speak_text_async(text)
+        except Exception as e:
+            with self.synthesizer_lock:
+                self.pending_fillers -= 1
+            logger.error(f"Error during filler speech synthesis: {e}")
+
+    def cancel(self):
+        # Stop the ongoing synthesis, e.g. when the user turns off speech mode in the middle of a reply
+        if self.speech_synthesizer is None:
+            return
+        # Queued fillers are stopped as well, so none of them is left to swallow the completion of a later reply
+        with self.synthesizer_lock:
+            self.pending_fillers = 0
+        try:
+            self.speech_synthesizer.stop_speaking_async()
+        except Exception as e:
+            logger.error(f"Error stopping speech synthesis: {e}")
@@ -21,10 +21,21 @@ class ActivityStatus(Enum):
 
 
 class StatusBar:
+    __slots__ = ("main_window", "processingLabel", "processingDots", "last_text", "paused", "animation_timer", "active_statuses", "base_text", "frames", "__weakref__")
+
+    ANIMATION_INTERVAL = 500
+    FRAMES = ("   ", ".  ", ".. ", "...")
+    STATUS_LABELS = {
+        ActivityStatus.PROCESSING_USER_INPUT: "User Input",
+        ActivityStatus.PROCESSING_SCHEDULED_TASK: "Scheduled Task"
+    }
+
     def __init__(self, main_window):
         self.main_window = main_window
         self.setup_status_bar()
         self.active_statuses = {}
+        self.base_text = ""
+        self.frames = ()
 
     def setup_status_bar(self):
         self.processingLabel = QLabel("", self.main_window)
@@ -32,43 +43,69 @@ class StatusBar:
         self.processingLabel.setAlignment(Qt.AlignRight)
 
         self.processingDots = 0
+        self.last_text = ""
+        self.paused = False
         self.animation_timer = QTimer()
+        # The dots animation does not need precise timing, a coarse timer lets the OS coalesce wakeups
+        self.animation_timer.setTimerType(Qt.CoarseTimer)
+        self.animation_timer.setInterval(self.ANIMATION_INTERVAL)
         self.animation_timer.timeout.connect(self.animate_processing_label)
 
-    def animate_processing_label(self):
-        frames = ["   ", ".  ", ".. ", "..."]
+    def update_base_text(self):
+        # The label prefix only changes when the active statuses change, so it is not rebuilt on every tick
         if ActivityStatus.LISTENING in self.active_statuses:
-            base_text = "Listening"
-            self.processingLabel.setText(f"{base_text}{frames[self.processingDots]}")
+            self.base_text = "Listening"
         elif ActivityStatus.PROCESSING in self.active_statuses:
-            base_text = "Processing"
-            self.processingLabel.setText(f"{base_text}{frames[self.processingDots]}")
+            self.base_text = "Processing"
         elif self.active_statuses:
-            status_labels = {
-                ActivityStatus.PROCESSING_USER_INPUT: "User Input",
-                ActivityStatus.PROCESSING_SCHEDULED_TASK: "Scheduled Task"
-            }
-            active_labels = [status_labels.get(status, "") for status in self.active_statuses.keys()]
+            active_labels = [self.STATUS_LABELS.get(status, "") for status in self.active_statuses.keys()]
             status_message = " | ".join(filter(None, active_labels))
-            base_text = f"Processing ({status_message})"
-            self.processingLabel.setText(f"{base_text}{frames[self.processingDots]}")
+            self.base_text = f"Processing ({status_message})"
+        else:
+            self.base_text = ""
+        self.frames = tuple(self.base_text + frame for frame in self.FRAMES)
+
+    def animate_processing_label(self):
+        if self.active_statuses:
+            self.set_label_text(self.frames[self.processingDots])
         else:
             self.stop_animation()
-        self.processingDots = (self.processingDots + 1) % 4
+        self.processingDots = (self.processingDots + 1) & 3
+
+    def set_label_text(self, text):
+        # Avoid relayouting and repainting the label when the text has not changed
+        if text != self.last_text:
+            self.last_text = text
+            self.processingLabel.setText(text)
 
-    def start_animation(self, status, interval=500):
+    def start_animation(self, status, interval=ANIMATION_INTERVAL):
         self.active_statuses[status] = status
+        self.update_base_text()
+        if self.paused:
+            return
         if not self.animation_timer.isActive():
-            self.animation_timer.setInterval(interval)
+            if interval != self.animation_timer.interval():
+                self.animation_timer.setInterval(interval)
             self.animation_timer.start()
         self.animate_processing_label()
 
     def stop_animation(self, status=None):
         if status in self.active_statuses:
             del self.active_statuses[status]
+            self.update_base_text()
         if not self.active_statuses:
             self.animation_timer.stop()
             self.processingLabel.clear()
+            self.last_text = ""
+
+    def set_paused(self, paused):
+        # The animation is not visible while the window is minimized, so avoid waking up the timer
+        self.paused = paused
+        if paused:
+            self.animation_timer.stop()
+        elif self.active_statuses and not self.animation_timer.isActive():
+            self.animation_timer.start()
+            self.animate_processing_label()
 
     def get_widget(self):
         """ Returns the main widget of the status bar. """
@@ -8,7 +8,7 @@ from PySide6.QtWidgets import QDialog, QComboBox, QFrame, QTabWidget, QScrollAre
 from PySide6.QtCore import Qt, QDateTime
 from PySide6.QtGui import QColor, QPalette, QIntValidator
 
-import json, os, threading, ast
+import json, os, ast
 
 from azure.ai.assistant.management.task import BasicTask, BatchTask, MultiTask
 from azure.ai.assistant.management.task_manager import TaskManager
@@ -16,6 +16,42 @@ from azure.ai.assistant.management.logger_module import logger
 from gui.signals import ErrorSignal, StartStatusAnimationSignal, StopStatusAnimationSignal
 from gui.status_bar import ActivityStatus, StatusBar
 
+# Input field border shared by the widgets of the task dialog, light on top and left, dark on bottom and right
+_INPUT_BORDER_STYLE_SHEET = (
+    "QLineEdit, QTextEdit, QListWidget {"
+    "  border-style: solid;"
+    "  border-width: 1px;"
+    "  border-color: #a0a0a0 #ffffff #ffffff #a0a0a0;"
+    "  padding: 1px;"
+    "}"
+)
+
+# Parsed task files by path, together with the modification time they were read at and the tasks indexed by id
+_TASKS_CACHE = {}
+
+
+def _cache_tasks(file_path, mtime, tasks):
+    cached = (mtime, tasks, {task['id']: task for task in tasks})
+    _TASKS_CACHE[file_path] = cached
+    return cached
+
+
+def _read_tasks(file_path):
+    # Return the cached tasks of the file, it is only read again when it has been modified
+    try:
+        mtime = os.stat(file_path).st_mtime_ns
+    except FileNotFoundError:
+        return None, [], {}
+    cached = _TASKS_CACHE.get(file_path)
+    if cached is None or cached[0] != mtime:
+        with open(file_path, "r") as file:
+            cached = _cache_tasks(file_path, mtime, json.load(file))
+    return cached
+
+
+def _load_tasks(file_path):
+    return _read_tasks(file_path)[1]
+
 
 class CreateTaskDialog(QDialog):
     def __init__(self, main_window, task_manager : TaskManager = None, config_folder="config"):
@@ -30,6 +66,7 @@ class CreateTaskDialog(QDialog):
         self.request_list = []
         self.setWindowTitle("Create/Edit Task")
         self.setGeometry(100, 100, 700, 600)
+        self.setStyleSheet(_INPUT_BORDER_STYLE_SHEET)
 
         layout = QVBoxLayout()
 
@@ -37,6 +74,13 @@ class CreateTaskDialog(QDialog):
         self.basic_task_selector = self.create_task_selector("Basic")
         self.batch_task_selector = self.create_task_selector("Batch")
         self.multi_task_selector = self.create_task_selector("Multi")
+        self.task_selectors = [
+            (self.basic_task_selector, "Basic"),
+            (self.batch_task_selector, "Batch"),
+            (self.multi_task_selector, "Multi")
+        ]
+        # Tabs whose dropdown needs to be reloaded when the tab is selected
+        self.dirty_tabs = set()
 
         # Set up tabs
         self.tabs = QTabWidget()
@@ -87,10 +131,14 @@ class CreateTaskDialog(QDialog):
 
     def stop_processing(self, status):
         self.status_bar.stop_animation(status)
+        self.generate_requests_btn.setEnabled(True)
         self.requests_list.clear()
         try:
-            # Convert the string representation of the list back to a list
-            actual_list = ast.literal_eval(self.request_list)
+            # Convert the string representation of the list back to a list, the requests are usually valid JSON
+            try:
+                actual_list = json.loads(self.request_list)
+            except ValueError:
+                actual_list = ast.literal_eval(self.request_list)
             # Join the list items into a single string with each item on a new line
             requests_text = "\n".join(actual_list)
             self.requests_list.setText(requests_text)
@@ -98,13 +146,16 @@ class CreateTaskDialog(QDialog):
             self.requests_list.setText(self.request_list)
         
     def on_tab_changed(self, index):
-        # Update dropdowns based on the selected tab
-        if index == 0:  # Basic Tab
-            self.load_and_display_tasks(self.basic_task_selector, "Basic")
-        elif index == 1:  # Batch Tab
-            self.load_and_display_tasks(self.batch_task_selector, "Batch")
-        elif index == 2:  # Multi Tab
-            self.load_and_display_tasks(self.basic_task_selector, "Multi")
+        if index == 2 and not self.multi_tab_created:
+            self.create_multi_tab_contents()
+        # Reload the dropdown of the selected tab only if tasks have been saved or removed on another tab
+        if index in self.dirty_tabs:
+            self.dirty_tabs.discard(index)
+            self.load_tab_tasks(index)
+
+    def load_tab_tasks(self, index):
+        task_selector, task_type = self.task_selectors[index]
+        self.load_and_display_tasks(task_selector, task_type)
 
     def on_task_selected(self, task_selector):
         task = task_selector.currentData()
@@ -138,6 +189,7 @@ class CreateTaskDialog(QDialog):
 
                     # Add new assistant at the end of the layout
                     self.assistants_layout.insertLayout(self.assistants_layout.count() - 1, assistant_layout)
+                    self.assistant_rows.append((request['assistant'], assistant_request))
         else:
             # "New Task" selected, enable input fields for new task details
             if active_tab_index == 0:
@@ -155,30 +207,20 @@ class CreateTaskDialog(QDialog):
                 self.clear_assistants()
 
     def clear_assistants(self):
-        # Remove all widgets and layouts in the assistants layout
-        while self.assistants_layout.count() > 0:
-            layout_item = self.assistants_layout.takeAt(0)
-
-            # If the item is a widget, remove it
-            if layout_item.widget():
-                layout_item.widget().deleteLater()
-
-            # If the item is a layout, recursively clear it and then delete it
-            elif layout_item.layout():
-                self.clear_layout(layout_item.layout())
-                layout_item.layout().deleteLater()
-        
-        # Re-add stretch to ensure proper alignment
-        self.assistants_layout.addStretch(1)
+        # Replace the container of the assistant rows instead of removing the rows one by one
+        self.scroll_area.takeWidget().deleteLater()
+        self.create_assistant_list_widget()
 
-    def clear_layout(self, layout):
-        while layout.count():
-            item = layout.takeAt(0)
-            widget = item.widget()
-            if widget is not None:
-                widget.deleteLater()
-            else:
-                self.clear_layout(item.layout())
+    def create_assistant_list_widget(self):
+        # Assistant names and request inputs of the rows, in the order they are shown
+        self.assistant_rows = []
+        self.assistant_list_widget = QWidget()
+        self.assistants_layout = QVBoxLayout(self.assistant_list_widget)
+        self.assistants_layout.setSpacing(5)  # Reduced spacing between assistants
+
+        # Add a stretch to push all items to the top
+        self.assistants_layout.addStretch(1)
+        self.scroll_area.setWidget(self.assistant_list_widget)
 
     def create_task_selector(self, task_type):
         task_selector = QComboBox()
@@ -187,34 +229,24 @@ class CreateTaskDialog(QDialog):
 
     def load_and_display_tasks(self, task_selector, task_type):
         tasks = self.load_tasks()
-        task_selector.clear()
-        task_selector.addItem("New Task", None)  # Default option for creating a new task
-        for task in tasks:
-            if task['type'] == task_type:
-                task_selector.addItem(task['name'], task)
+        # Rebuild the items without notifying every insertion, the selection change is notified once at the end
+        task_selector.blockSignals(True)
+        try:
+            task_selector.clear()
+            task_selector.addItem("New Task", None)  # Default option for creating a new task
+            for task in tasks:
+                if task['type'] == task_type:
+                    task_selector.addItem(task['name'], task)
+        finally:
+            task_selector.blockSignals(False)
+        task_selector.currentIndexChanged.emit(task_selector.currentIndex())
 
     def create_basic_tab(self):
         basic_tab = QWidget()
         basic_layout = QVBoxLayout()
         basic_layout.addWidget(self.basic_task_selector)
         self.task_name_input = QLineEdit()
-        self.task_name_input.setStyleSheet(
-            "QLineEdit {"
-            "  border-style: solid;"
-            "  border-width: 1px;"
-            "  border-color: #a0a0a0 #ffffff #ffffff #a0a0a0;"  # Light on top and left, dark on bottom and right
-            "  padding: 1px;"
-            "}"
-        )
         self.user_request_basic = QTextEdit()
-        self.user_request_basic.setStyleSheet(
-            "QTextEdit {"
-            "  border-style: solid;"
-            "  border-width: 1px;"
-            "  border-color: #a0a0a0 #ffffff #ffffff #a0a0a0;"  # Light on top and left, dark on bottom and right
-            "  padding: 1px;"
-            "}"
-        )
         basic_layout.addWidget(QLabel("Task Name:"))
         basic_layout.addWidget(self.task_name_input)
         basic_layout.addWidget(QLabel("User Request:"))
@@ -227,24 +259,8 @@ class CreateTaskDialog(QDialog):
         batch_layout = QVBoxLayout()
         batch_layout.addWidget(self.batch_task_selector)
         self.batch_name_input = QLineEdit()
-        self.batch_name_input.setStyleSheet(
-            "QLineEdit {"
-            "  border-style: solid;"
-            "  border-width: 1px;"
-            "  border-color: #a0a0a0 #ffffff #ffffff #a0a0a0;"  # Light on top and left, dark on bottom and right
-            "  padding: 1px;"
-            "}"
-        )
         self.src_folders_list = QListWidget()
         self.src_folders_list.setMaximumHeight(100)
-        self.src_folders_list.setStyleSheet(
-            "QListWidget {"
-            "  border-style: solid;"
-            "  border-width: 1px;"
-            "  border-color: #a0a0a0 #ffffff #ffffff #a0a0a0;"  # Light on top and left, dark on bottom and right
-            "  padding: 1px;"
-            "}"
-        )
         add_remove_layout = QHBoxLayout()
         add_src_folder_btn = QPushButton("Add Folder...")
         remove_src_folder_btn = QPushButton("Remove Folder")
@@ -253,26 +269,10 @@ class CreateTaskDialog(QDialog):
         add_src_folder_btn.clicked.connect(self.add_folder)
         remove_src_folder_btn.clicked.connect(self.remove_folder)
         self.user_request_batch = QTextEdit()
-        self.user_request_batch.setStyleSheet(
-            "QTextEdit {"
-            "  border-style: solid;"
-            "  border-width: 1px;"
-            "  border-color: #a0a0a0 #ffffff #ffffff #a0a0a0;"  # Light on top and left, dark on bottom and right
-            "  padding: 1px;"
-            "}"
-        )
         self.user_request_batch.setMaximumHeight(50)
         self.requests_list = QTextEdit()
-        self.requests_list.setStyleSheet(
-            "QTextEdit {"
-            "  border-style: solid;"
-            "  border-width: 1px;"
-            "  border-color: #a0a0a0 #ffffff #ffffff #a0a0a0;"  # Light on top and left, dark on bottom and right
-            "  padding: 1px;"
-            "}"
-        )
-        generate_requests_btn = QPushButton("Generate Requests with AI...")
-        generate_requests_btn.clicked.connect(self.generate_requests)
+        self.generate_requests_btn = QPushButton("Generate Requests with AI...")
+        self.generate_requests_btn.clicked.connect(self.generate_requests)
 
         batch_layout.addWidget(QLabel("Task Name:"))
         batch_layout.addWidget(self.batch_name_input)
@@ -281,7 +281,7 @@ class CreateTaskDialog(QDialog):
         batch_layout.addLayout(add_remove_layout)
         batch_layout.addWidget(QLabel("User Request:"))
         batch_layout.addWidget(self.user_request_batch)
-        batch_layout.addWidget(generate_requests_btn)
+        batch_layout.addWidget(self.generate_requests_btn)
         batch_layout.addWidget(QLabel("Generated Requests"))
         batch_layout.addWidget(self.requests_list)
 
@@ -289,19 +289,18 @@ class CreateTaskDialog(QDialog):
         return batch_tab
 
     def create_multi_tab(self):
+        # Only the task selector is created here, the rest of the tab is created when the tab is first selected
         multi_tab = QWidget()
         self.multi_tab_layout = QVBoxLayout()
         self.multi_tab_layout.addWidget(self.multi_task_selector)
+        multi_tab.setLayout(self.multi_tab_layout)
+        self.multi_tab_created = False
 
+        return multi_tab
+
+    def create_multi_tab_contents(self):
+        self.multi_tab_created = True
         self.multi_name_input = QLineEdit()
-        self.multi_name_input.setStyleSheet(
-            "QLineEdit {"
-            "  border-style: solid;"
-            "  border-width: 1px;"
-            "  border-color: #a0a0a0 #ffffff #ffffff #a0a0a0;"  # Light on top and left, dark on bottom and right
-            "  padding: 1px;"
-            "}"
-        )
         # ComboBox and button at the top
         top_layout = QHBoxLayout()
         assistants = self.main_window.assistant_config_manager.get_all_assistant_names()
@@ -317,20 +316,11 @@ class CreateTaskDialog(QDialog):
         # Scroll Area for assistants
         self.scroll_area = QScrollArea()
         self.scroll_area.setWidgetResizable(True)
-        self.assistant_list_widget = QWidget()
-        self.assistants_layout = QVBoxLayout(self.assistant_list_widget)
-        self.assistants_layout.setSpacing(5)  # Reduced spacing between assistants
-        self.scroll_area.setWidget(self.assistant_list_widget)
-
-        # Add a stretch to push all items to the top
-        self.assistants_layout.addStretch(1)
+        self.create_assistant_list_widget()
 
         self.multi_tab_layout.addWidget(QLabel("Task Name:"))
         self.multi_tab_layout.addWidget(self.multi_name_input)
         self.multi_tab_layout.addWidget(self.scroll_area)
-        multi_tab.setLayout(self.multi_tab_layout)
-
-        return multi_tab
 
     def add_selected_assistant(self):
         selected_assistant = self.assistant_selection.currentText()
@@ -339,13 +329,16 @@ class CreateTaskDialog(QDialog):
         assistant_request = QLineEdit()
         assistant_request.setPlaceholderText("Enter request for " + selected_assistant)
         remove_button = QPushButton('Remove')
-        remove_button.clicked.connect(lambda: self.remove_assistant(assistant_layout))
+        assistant_row = (selected_assistant, assistant_request)
+        remove_button.clicked.connect(lambda: self.remove_assistant(assistant_layout, assistant_row))
         assistant_layout.addWidget(assistant_label)
         assistant_layout.addWidget(assistant_request)
         assistant_layout.addWidget(remove_button)
         self.assistants_layout.insertLayout(self.assistants_layout.count() - 1, assistant_layout)
+        self.assistant_rows.append(assistant_row)
 
-    def remove_assistant(self, assistant_layout):
+    def remove_assistant(self, assistant_layout, assistant_row):
+        self.assistant_rows.remove(assistant_row)
         # Remove all widgets in the layout
         while assistant_layout.count():
             item = assistant_layout.takeAt(0)
@@ -355,6 +348,13 @@ class CreateTaskDialog(QDialog):
         # Remove the layout itself
         self.assistants_layout.removeItem(assistant_layout)
 
+    def get_assistant_requests(self):
+        return [{"assistant": assistant, "task": request_input.text()} for assistant, request_input in self.assistant_rows]
+
+    def get_src_folders(self):
+        src_folders_list = self.src_folders_list
+        return [src_folders_list.item(i).text() for i in range(src_folders_list.count())]
+
     def add_folder(self):
         folder_path = QFileDialog.getExistingDirectory(self, "Select Folder")
         if folder_path:
@@ -367,14 +367,16 @@ class CreateTaskDialog(QDialog):
             self.src_folders_list.takeItem(row)
 
     def load_tasks(self):
-        file_path = os.path.join("config", "assistant_tasks.json")
-        if os.path.exists(file_path):
-            with open(file_path, "r") as file:
-                return json.load(file)
-        return []
+        return _load_tasks(os.path.join(self.config_folder, "assistant_tasks.json"))
+
+    def load_tasks_and_index(self):
+        _, tasks, tasks_by_id = _read_tasks(os.path.join(self.config_folder, "assistant_tasks.json"))
+        return tasks, tasks_by_id
 
     def generate_requests(self):
-        threading.Thread(target=self._generate_requests, args=()).start()
+        # Run one generation at a time, the button is enabled again when processing stops
+        self.generate_requests_btn.setEnabled(False)
+        self.main_window.executor.submit(self._generate_requests)
     
     def _generate_requests(self):
         try:
@@ -390,7 +392,7 @@ class CreateTaskDialog(QDialog):
                 error_message = "Please enter a request."
                 raise Exception(error_message)
 
-            folders_list = [self.src_folders_list.item(i).text() for i in range(self.src_folders_list.count())]
+            folders_list = self.get_src_folders()
             user_request = user_request + " Input folders:" + " ".join(folders_list)
             self.request_list = self.task_requests_creator.process_messages(user_request=user_request, stream=False)
 
@@ -431,13 +433,7 @@ class CreateTaskDialog(QDialog):
                     requests = requests_text.split('\n')  # Split requests by newline
                     new_task = self.task_manager.create_batch_task(requests)
                 elif active_tab_index == 2:  # Multi Task
-                    requests = []
-                    for i in range(self.assistants_layout.count() - 1):  # Exclude the stretch at the end
-                        layout = self.assistants_layout.itemAt(i).layout()
-                        if isinstance(layout, QHBoxLayout):
-                            assistant_label = layout.itemAt(0).widget().text().rstrip(':')
-                            assistant_request = layout.itemAt(1).widget().text()
-                            requests.append({"assistant": assistant_label, "task": assistant_request})
+                    requests = self.get_assistant_requests()
                     new_task = self.task_manager.create_multi_task(requests)
                 self.add_new_task_to_file(task_name, new_task)
             else:
@@ -450,27 +446,19 @@ class CreateTaskDialog(QDialog):
             QMessageBox.warning(self, "Error", f"An error occurred while saving the task: {e}")
 
     def update_existing_task(self, task_id):
-        tasks = self.load_tasks()
-        for task in tasks:
-            if task['id'] == task_id:
-                if task['type'] == "Basic":
-                    task['name'] = self.task_name_input.text()
-                    task['user_request'] = self.user_request_basic.toPlainText()
-                elif task['type'] == "Batch":
-                    task['name'] = self.batch_name_input.text()
-                    task['requests'] = self.requests_list.toPlainText().split('\n')
-                    task['input_folders'] = [self.src_folders_list.item(i).text() for i in range(self.src_folders_list.count())]
-                elif task['type'] == "Multi":
-                    task['name'] = self.multi_name_input.text()
-                    requests = []
-                    for i in range(self.assistants_layout.count() - 1):  # Exclude the stretch at the end
-                        layout = self.assistants_layout.itemAt(i).layout()
-                        if isinstance(layout, QHBoxLayout):
-                            assistant_label = layout.itemAt(0).widget().text().rstrip(':')
-                            assistant_request = layout.itemAt(1).widget().text()
-                            requests.append({"assistant": assistant_label, "task": assistant_request})
-                    task['requests'] = requests
-                break
+        tasks, tasks_by_id = self.load_tasks_and_index()
+        task = tasks_by_id.get(task_id)
+        if task is not None:
+            if task['type'] == "Basic":
+                task['name'] = self.task_name_input.text()
+                task['user_request'] = self.user_request_basic.toPlainText()
+            elif task['type'] == "Batch":
+                task['name'] = self.batch_name_input.text()
+                task['requests'] = self.requests_list.toPlainText().split('\n')
+                task['input_folders'] = self.get_src_folders()
+            elif task['type'] == "Multi":
+                task['name'] = self.multi_name_input.text()
+                task['requests'] = self.get_assistant_requests()
         self.save_tasks_to_file(tasks)
 
     def add_new_task_to_file(self, task_name, task):
@@ -484,7 +472,7 @@ class CreateTaskDialog(QDialog):
             task_data["user_request"] = task.user_request
         elif isinstance(task, BatchTask):
             task_data["requests"] = task.requests
-            task_data["input_folders"] = [self.src_folders_list.item(i).text() for i in range(self.src_folders_list.count())]
+            task_data["input_folders"] = self.get_src_folders()
         elif isinstance(task, MultiTask):
             task_data["requests"] = [{"assistant": req["assistant"], "task": req["task"]} for req in task.requests]
 
@@ -494,8 +482,17 @@ class CreateTaskDialog(QDialog):
 
     def save_tasks_to_file(self, tasks):
         file_path = os.path.join(self.config_folder, "assistant_tasks.json")
-        with open(file_path, "w") as file:
-            json.dump(tasks, file, indent=4)
+        # Write to a temporary file and replace the task file with it so a failed write cannot truncate it
+        temp_file_path = file_path + ".tmp"
+        try:
+            with open(temp_file_path, "w") as file:
+                json.dump(tasks, file, indent=4)
+            os.replace(temp_file_path, file_path)
+        except Exception:
+            # The cached tasks may have been modified for this save, read them again from the file next time
+            _TASKS_CACHE.pop(file_path, None)
+            raise
+        _cache_tasks(file_path, os.stat(file_path).st_mtime_ns, tasks)
 
     def remove_task(self):
         try:
@@ -515,25 +512,22 @@ class CreateTaskDialog(QDialog):
 
             if reply == QMessageBox.Yes:
                 self.delete_task_from_file(selected_task['id'])
-                if active_tab_index == 0:
-                    self.load_and_display_tasks(self.basic_task_selector, "Basic")
-                elif active_tab_index == 1:
-                    self.load_and_display_tasks(self.batch_task_selector, "Batch")
-                elif active_tab_index == 2:
-                    self.load_and_display_tasks(self.multi_task_selector, "Multi")
                 self.refresh_dropdowns()
         except Exception as e:
             QMessageBox.warning(self, "Error", f"An error occurred while removing the task: {e}")
 
     def delete_task_from_file(self, task_id):
-        tasks = self.load_tasks()
-        tasks = [task for task in tasks if task['id'] != task_id]
+        tasks, tasks_by_id = self.load_tasks_and_index()
+        task = tasks_by_id.get(task_id)
+        if task is not None:
+            tasks.remove(task)
         self.save_tasks_to_file(tasks)
 
     def refresh_dropdowns(self):
-        self.load_and_display_tasks(self.basic_task_selector, "Basic")
-        self.load_and_display_tasks(self.batch_task_selector, "Batch")
-        self.load_and_display_tasks(self.multi_task_selector, "Multi")
+        # Only the visible dropdown is refreshed, the others are reloaded when their tab is selected
+        current_index = self.tabs.currentIndex()
+        self.load_tab_tasks(current_index)
+        self.dirty_tabs.update(index for index in range(len(self.task_selectors)) if index != current_index)
 
 
 class ScheduleTaskDialog(QDialog):
@@ -609,15 +603,10 @@ class ScheduleTaskDialog(QDialog):
                 self.assistant_selection.setEnabled(True)
 
     def load_tasks_into_dropdown(self):
-        self.tasks_by_id = {}
-        file_path = os.path.join(self.config_folder, "assistant_tasks.json")
-        if os.path.exists(file_path):
-            with open(file_path, "r") as file:
-                tasks = json.load(file)
-            for task in tasks:
-                # Assuming each task has a 'name' and 'id' attribute
-                self.task_selection.addItem(task['name'], task['id'])
-                self.tasks_by_id[task['id']] = task
+        _, tasks, self.tasks_by_id = _read_tasks(os.path.join(self.config_folder, "assistant_tasks.json"))
+        for task in tasks:
+            # Assuming each task has a 'name' and 'id' attribute
+            self.task_selection.addItem(task['name'], task['id'])
 
         # If the file doesn't exist or there are no tasks, do nothing
 
@@ -656,18 +645,15 @@ class ScheduleTaskDialog(QDialog):
             QMessageBox.warning(self, "Task Not Found", "Selected task not found.")
 
     def get_task_by_id(self, task_id):
-        file_path = os.path.join(self.config_folder, "assistant_tasks.json")
-        if os.path.exists(file_path):
-            with open(file_path, "r") as file:
-                tasks = json.load(file)
-            for task in tasks:
-                if task['id'] == task_id:
-                    if task['type'] == "Basic":
-                        return self.task_manager.create_basic_task(task['user_request'])
-                    elif task['type'] == "Batch":
-                        return self.task_manager.create_batch_task(task['requests'])
-                    elif task['type'] == "Multi":
-                        return self.task_manager.create_multi_task(task['requests'])
+        _, _, tasks_by_id = _read_tasks(os.path.join(self.config_folder, "assistant_tasks.json"))
+        task = tasks_by_id.get(task_id)
+        if task is not None:
+            if task['type'] == "Basic":
+                return self.task_manager.create_basic_task(task['user_request'])
+            elif task['type'] == "Batch":
+                return self.task_manager.create_batch_task(task['requests'])
+            elif task['type'] == "Multi":
+                return self.task_manager.create_multi_task(task['requests'])
         return None
 
 
@@ -7,12 +7,21 @@
 from PySide6.QtWidgets import QMessageBox
 
 import sys, os, re
+from functools import lru_cache
 
 from azure.ai.assistant.management.logger_module import logger
 from azure.ai.assistant.management.assistant_config import AssistantConfig
 from azure.ai.assistant.management.ai_client_factory import AIClientType
 from azure.ai.assistant.management.chat_assistant_client import ChatAssistantClient
 
+# Assistant type values carried by the assistant configs and the assistant config dialogs
+ASSISTANT_TYPE = "assistant"
+CHAT_ASSISTANT_TYPE = "chat_assistant"
+
+_WORD_PATTERN = re.compile(r'\S+')
+_CAMEL_WORD_PATTERN = re.compile('(.)([A-Z][a-z]+)')
+_CAMEL_CASE_PATTERN = re.compile('([a-z0-9])([A-Z])')
+
 
 def resource_path(relative_path):
     """ 
@@ -31,12 +40,28 @@ def resource_path(relative_path):
     return path
 
 
+def has_min_words(text, min_words):
+    """
+    Check if the text has at least the given number of words, without splitting the whole text
+    """
+    # Every word but the last one is followed by at least one separator
+    if len(text) < 2 * min_words - 1:
+        return False
+    words = 0
+    for _ in _WORD_PATTERN.finditer(text):
+        words += 1
+        if words >= min_words:
+            return True
+    return False
+
+
+@lru_cache(maxsize=128)
 def camel_to_snake(name):
     """
     Convert camel case to snake case
     """
-    name = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', name)
-    return re.sub('([a-z0-9])([A-Z])', r'\1_\2', name).lower()
+    name = _CAMEL_WORD_PATTERN.sub(r'\1_\2', name)
+    return _CAMEL_CASE_PATTERN.sub(r'\1_\2', name).lower()
 
 
 def init_system_assistant(instance, assistant_name: str):
@@ -9,7 +9,7 @@ from azure.ai.assistant.management.async_message import AsyncConversationMessage
 from azure.ai.assistant.management.assistant_config_manager import AssistantConfigManager
 import azure.identity.aio
 
-from quart import Blueprint, jsonify, request, Response, render_template, current_app
+from quart import Blueprint, jsonify, request, Response, render_template, current_app, send_file
 
 import asyncio
 import json, os
@@ -183,17 +183,12 @@ async def fetch_document():
         return jsonify({"error": f"File not found: {filename}"}), 404
 
     try:
-        # Read the file content asynchronously using asyncio.to_thread
-        data = await asyncio.to_thread(read_file, full_path)
-        return Response(data, content_type='text/plain')
+        # Stream the file content asynchronously in chunks instead of reading the whole file into memory
+        return await send_file(full_path, mimetype='text/plain')
 
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
-def read_file(path):
-    with open(path, 'r') as file:
-        return file.read()
-
 @bp.route('/stream/<thread_name>', methods=['GET'])
 async def stream_responses(thread_name):
     # Set necessary headers for SSE
@@ -218,10 +213,23 @@ async def stream_responses(thread_name):
 
     async def event_stream():
         try:
+            pending = None
             while True:
-                message_type, message = await message_queue.get()
+                if pending is not None:
+                    message_type, message = pending
+                    pending = None
+                else:
+                    message_type, message = await message_queue.get()
 
                 if message_type == "message":
+                    # Send the stream chunks that are already queued in one event instead of an event per chunk
+                    while not message_queue.empty():
+                        next_message = message_queue.get_nowait()
+                        if next_message[0] != "message":
+                            pending = next_message
+                            break
+                        message += next_message[1]
+                        message_queue.task_done()
                     event_data = json.dumps({'content': message, 'type': message_type})
                     yield f"data: {event_data}\n\n"
                 elif message_type == "completed_message":